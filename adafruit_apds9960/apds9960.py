@@ -43,9 +43,10 @@ from micropython import const
 
 try:
     # Only used for typing
-    from typing import Tuple
+    from typing import Iterator, Optional, Tuple
 
     from busio import I2C
+    from digitalio import DigitalInOut
 except ImportError:
     pass
 
@@ -89,20 +90,20 @@ _APDS9960_GPENTH = const(0xA0)
 _APDS9960_GEXTH = const(0xA1)
 _APDS9960_GCONF1 = const(0xA2)
 _APDS9960_GCONF2 = const(0xA3)
-# _APDS9960_GOFFSET_U  = const(0xA4)
-# _APDS9960_GOFFSET_D  = const(0xA5)
-# _APDS9960_GOFFSET_L  = const(0xA7)
-# _APDS9960_GOFFSET_R  = const(0xA9)
+_APDS9960_GOFFSET_U = const(0xA4)
+_APDS9960_GOFFSET_D = const(0xA5)
+_APDS9960_GOFFSET_L = const(0xA7)
+_APDS9960_GOFFSET_R = const(0xA9)
 _APDS9960_GPULSE = const(0xA6)
-# _APDS9960_GCONF3 = const(0xAA)
+_APDS9960_GCONF3 = const(0xAA)
 _APDS9960_GCONF4 = const(0xAB)
-_APDS9960_GFLVL = const(0xAE)
-_APDS9960_GSTATUS = const(0xAF)
+# _APDS9960_GFLVL = const(0xAE)
+# _APDS9960_GSTATUS = const(0xAF)
 # _APDS9960_IFORCE     = const(0xE4)
 # _APDS9960_PICLEAR    = const(0xE5)
-# _APDS9960_CICLEAR    = const(0xE6)
+_APDS9960_CICLEAR = const(0xE6)
 _APDS9960_AICLEAR = const(0xE7)
-_APDS9960_GFIFO_U = const(0xFC)
+# _APDS9960_GFIFO_U = const(0xFC)
 # APDS9960_GFIFO_D    = const(0xFD)
 # APDS9960_GFIFO_L    = const(0xFE)
 # APDS9960_GFIFO_R    = const(0xFF)
@@ -110,11 +111,18 @@ _APDS9960_GFIFO_U = const(0xFC)
 _BIT_MASK_ENABLE_EN = const(0x01)
 _BIT_MASK_ENABLE_COLOR = const(0x02)
 _BIT_MASK_ENABLE_PROX = const(0x04)
+_BIT_MASK_ENABLE_COLOR_INT = const(0x10)
 _BIT_MASK_ENABLE_PROX_INT = const(0x20)
 _BIT_MASK_ENABLE_GESTURE = const(0x40)
 _BIT_MASK_STATUS_AVALID = const(0x01)
+_BIT_MASK_STATUS_PVALID = const(0x02)
 _BIT_MASK_STATUS_GINT = const(0x04)
-_BIT_MASK_GSTATUS_GFOV = const(0x02)
+_BIT_MASK_STATUS_AINT = const(0x10)
+_BIT_MASK_STATUS_PINT = const(0x20)
+_BIT_MASK_STATUS_PGSAT = const(0x40)
+_BIT_MASK_STATUS_CPSAT = const(0x80)
+_BIT_MASK_GCONF4_GMODE = const(0x01)
+_BIT_MASK_GCONF4_GIEN = const(0x02)
 _BIT_MASK_GCONF4_GFIFO_CLR = const(0x04)
 
 _BIT_POS_PERS_PPERS = const(4)
@@ -126,9 +134,50 @@ _BIT_MASK_CONTROL_AGAIN = const(3)
 _BIT_POS_CONTROL_PGAIN = const(2)
 _BIT_MASK_CONTROL_PGAIN = const(0x0C)
 
+_BIT_POS_GCONF1_GFIFOTH = const(6)
+_BIT_MASK_GCONF1_GFIFOTH = const(0xC0)
+
 _BIT_POS_GCONF2_GGAIN = const(5)
 _BIT_MASK_GCONF2_GGAIN = const(0x60)
 
+_BIT_POS_GCONF2_GWTIME = const(0)
+_BIT_MASK_GCONF2_GWTIME = const(0x07)
+
+_BIT_POS_GCONF2_GLDRIVE = const(3)
+_BIT_MASK_GCONF2_GLDRIVE = const(0x18)
+
+_BIT_POS_GPULSE_GPULSE = const(0)
+_BIT_MASK_GPULSE_GPULSE = const(0x3F)
+
+_BIT_POS_GPULSE_GPLEN = const(6)
+_BIT_MASK_GPULSE_GPLEN = const(0xC0)
+
+_BIT_POS_GCONF3_GDIMS = const(0)
+_BIT_MASK_GCONF3_GDIMS = const(0x03)
+
+# Configuration registers that are only ever changed by the host, and so can be shadowed in RAM.
+# GCONF4 is deliberately excluded since the sensor updates GMODE and GFIFO_CLR on its own.
+_SHADOW_REGISTERS = (
+    _APDS9960_ENABLE,
+    _APDS9960_ATIME,
+    _APDS9960_PILT,
+    _APDS9960_PIHT,
+    _APDS9960_PERS,
+    _APDS9960_CONTROL,
+    _APDS9960_GPENTH,
+    _APDS9960_GEXTH,
+    _APDS9960_GCONF1,
+    _APDS9960_GCONF2,
+    _APDS9960_GOFFSET_U,
+    _APDS9960_GOFFSET_D,
+    _APDS9960_GPULSE,
+    _APDS9960_GOFFSET_L,
+    _APDS9960_GOFFSET_R,
+    _APDS9960_GCONF3,
+)
+# (start register, length) of the burst reads that cover every shadowed register
+_SHADOW_BLOCKS = ((_APDS9960_ENABLE, 16), (_APDS9960_GPENTH, 11))
+
 
 class APDS9960:
     """
@@ -138,7 +187,23 @@ class APDS9960:
     :param int rotation: Rotation of the device. Defaults to :const:`0`
     :param bool reset: If true, reset device on init. Defaults to :const:`True`
     :param bool set_defaults: If true, set sensible defaults on init. Defaults to :const:`True`
-
+    :param bool cache: If true, keep a write-through copy of the configuration registers in RAM.
+        Configuration getters are then answered without any I2C traffic and setters become a
+        single write. Call `resync` if the sensor may have been reconfigured by something else.
+        Defaults to :const:`False`
+    :param interrupt_pin: Optional input connected to the sensor's ``INT`` pin, such as a
+        `digitalio.DigitalInOut` with a pull-up. Any object with a ``value`` attribute that reads
+        ``False`` while the interrupt is asserted will do. When given, `interrupt_status` only
+        talks to the sensor while the interrupt is asserted. Defaults to :const:`None`
+    :param clock: Object with ``monotonic()`` and ``sleep(seconds)`` functions that the driver
+        uses for all of its timing, in place of the `time` module. For example a
+        `~adafruit_apds9960.replay.ReplayI2C`, so replaying a recording doesn't have to wait
+        through the recorded delays. Defaults to :const:`None`, which uses `time`
+    :param bool fast_init: If true, ``reset`` and ``set_defaults`` are done with burst writes. The
+        25 ms shutdown delay is replaced with polling the gesture engine, and only when it was
+        running, and the 10 ms power on delay is skipped, as registers can be written while it
+        finishes. The first readings may then take up to 10 ms longer to arrive.
+        Defaults to :const:`False`
 
     **Quickstart: Importing and using the APDS9960**
 
@@ -170,19 +235,50 @@ class APDS9960:
     """
 
     def __init__(
-        self, i2c: I2C, *, rotation: int = 0, reset: bool = True, set_defaults: bool = True
+        self,
+        i2c: I2C,
+        *,
+        rotation: int = 0,
+        reset: bool = True,
+        set_defaults: bool = True,
+        cache: bool = False,
+        fast_init: bool = False,
+        interrupt_pin: Optional[DigitalInOut] = None,
+        clock=None,
     ):
         self.rotation = rotation
+        self._clock = time if clock is None else clock
+        self._interrupt_pin = interrupt_pin
 
         self.buf129 = None  # Gesture FIFO buffer, only instantiated if needed
-        self.buf4 = None  # Gesture data processing buffer, only instantiated if needed
+        self.buf9 = None  # gesture() first/last datasets, only instantiated if needed
+        self.buf16 = None  # resync() register block buffer, only instantiated if needed
+        self._gesture_frame = None  # gesture_poll() datasets, only instantiated if needed
+        self._gesture_last_data = None  # When gesture data last arrived, if in a gesture
+        self._trajectory = None  # gesture_trajectory() state, only instantiated if needed
+        self._gesture_interrupt = False  # Whether enable_gesture_interrupt was turned on
+        self._gesture_stats = None  # Gesture FIFO statistics, only instantiated if needed
         self.buf2 = bytearray(2)  # I2C communication buffer
+        self.buf10 = bytearray(10)  # Status/color/proximity burst buffer
 
         self.i2c_device = I2CDevice(i2c, _APDS9960_I2C_ADDRESS)
 
+        self._shadow = None  # Configuration register shadow, only instantiated if needed
+        self._pending = None  # Queued register writes, only instantiated inside batch()
+        self._batch_depth = 0
+        self._color_settings = 0  # Bumped whenever color_gain or color_integration_time may change
+
         if self._read8(_APDS9960_ID) not in _DEVICE_IDS:
             raise RuntimeError()
 
+        if cache:
+            self._shadow = dict.fromkeys(_SHADOW_REGISTERS, 0)
+            self.resync()
+
+        if reset and fast_init:
+            self._fast_reset(set_defaults)
+            return
+
         if reset:
             # Disable prox, gesture, and color engines
             self.enable_proximity = False
@@ -190,15 +286,7 @@ class APDS9960:
             self.enable_color = False
 
             # Reset basic config registers to power-on defaults
-            self.proximity_interrupt_threshold = (0, 0, 0)
-            self._write8(_APDS9960_GPENTH, 0)
-            self._write8(_APDS9960_GEXTH, 0)
-            self._write8(_APDS9960_GCONF1, 0)
-            self._write8(_APDS9960_GCONF2, 0)
-            self._write8(_APDS9960_GCONF4, 0)
-            self._write8(_APDS9960_GPULSE, 0)
-            self._write8(_APDS9960_ATIME, 255)
-            self._write8(_APDS9960_CONTROL, 0)
+            self._reset_registers()
 
             # Clear all non-gesture interrupts
             self.clear_interrupt()
@@ -208,29 +296,70 @@ class APDS9960:
 
             # Disable sensor and all functions/interrupts
             self._write8(_APDS9960_ENABLE, 0)
-            time.sleep(0.025)  # Sleeping could take at ~2-25 ms if engines were looping
+            self._clock.sleep(0.025)  # Sleeping could take at ~2-25 ms if engines were looping
 
             # Re-enable sensor and wait 10ms for the power on delay to finish
             self.enable = True
-            time.sleep(0.010)
+            self._clock.sleep(0.010)
 
         if set_defaults:
-            # Trigger proximity interrupt at >= 5, PPERS: 4 cycles
-            self.proximity_interrupt_threshold = (0, 5, 4)
-            # Enter gesture engine at >= 5 proximity counts
-            self._write8(_APDS9960_GPENTH, 0x05)
-            # Exit gesture engine if all counts drop below 30
-            self._write8(_APDS9960_GEXTH, 0x1E)
-            # GEXPERS: 2 (4 cycles), GEXMSK: 0 (default) GFIFOTH: 2 (8 datasets)
-            self._write8(_APDS9960_GCONF1, 0x82)
-            # GGAIN: 2 (4x), GLDRIVE: 100 mA (default), GWTIME: 1 (2.8ms)
-            self._write8(_APDS9960_GCONF2, 0x41)
-            # GPULSE: 5 (6 pulses), GPLEN: 2 (16 us)
-            self._write8(_APDS9960_GPULSE, 0x85)
-            # ATIME: 256 (712ms color integration time, max count of 65535)
-            self.color_integration_time = 256
-            # AGAIN: 1 (4x color gain)
-            self.color_gain = 1
+            self._set_defaults()
+
+    def _reset_registers(self) -> None:
+        """Writes power-on defaults to the basic config registers"""
+        self.proximity_interrupt_threshold = (0, 0, 0)
+        self._write8(_APDS9960_GPENTH, 0)
+        self._write8(_APDS9960_GEXTH, 0)
+        self._write8(_APDS9960_GCONF1, 0)
+        self._write8(_APDS9960_GCONF2, 0)
+        self._write8(_APDS9960_GCONF4, 0)
+        self._write8(_APDS9960_GPULSE, 0)
+        self._write8(_APDS9960_ATIME, 255)
+        self._write8(_APDS9960_CONTROL, 0)
+        self._color_settings += 1
+
+    def _set_defaults(self) -> None:
+        """Writes the driver's sensible defaults to the config registers"""
+        # Trigger proximity interrupt at >= 5, PPERS: 4 cycles
+        self.proximity_interrupt_threshold = (0, 5, 4)
+        # Enter gesture engine at >= 5 proximity counts
+        self._write8(_APDS9960_GPENTH, 0x05)
+        # Exit gesture engine if all counts drop below 30
+        self._write8(_APDS9960_GEXTH, 0x1E)
+        # GEXPERS: 2 (4 cycles), GEXMSK: 0 (default) GFIFOTH: 2 (8 datasets)
+        self._write8(_APDS9960_GCONF1, 0x82)
+        # GGAIN: 2 (4x), GLDRIVE: 100 mA (default), GWTIME: 1 (2.8ms)
+        self._write8(_APDS9960_GCONF2, 0x41)
+        # GPULSE: 5 (6 pulses), GPLEN: 2 (16 us)
+        self._write8(_APDS9960_GPULSE, 0x85)
+        # ATIME: 256 (712ms color integration time, max count of 65535)
+        self.color_integration_time = 256
+        # AGAIN: 1 (4x color gain)
+        self.color_gain = 1
+
+    def _fast_reset(self, set_defaults: bool) -> None:
+        """Resets the sensor with burst writes, without the fixed reset delays"""
+        # Only a running gesture engine needs time to wind down after being disabled
+        gesture_running = self._get_bit(_APDS9960_ENABLE, _BIT_MASK_ENABLE_GESTURE)
+
+        # Disable sensor and all functions/interrupts
+        self._write8(_APDS9960_ENABLE, 0)
+        if gesture_running:
+            self._poll_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GMODE, False, 0.025)
+
+        with self.batch():
+            self._reset_registers()
+            # Clear gesture FIFOs and interrupt
+            self._set_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GFIFO_CLR, True)
+            if set_defaults:
+                self._set_defaults()
+
+        # Clear all non-gesture interrupts
+        self.clear_interrupt()
+
+        # Re-enable sensor. Registers can be written while the power on delay finishes, so it
+        # isn't waited for. The engines simply start once it is over.
+        self._write8(_APDS9960_ENABLE, _BIT_MASK_ENABLE_EN)
 
     ## BOARD
     @property
@@ -403,6 +532,55 @@ class APDS9960:
         """
         self._writecmdonly(_APDS9960_AICLEAR)
 
+    def clear_color_interrupt(self) -> None:
+        """Clears the color/light interrupts only, leaving any proximity interrupts asserted.
+
+        This includes:
+
+        * **Color/Light Interrupt** (``STATUS<AINT>``)
+        * **Color/Light Clear Saturation Interrupt** (``STATUS<CPSAT>``)
+        """
+        self._writecmdonly(_APDS9960_CICLEAR)
+
+    ## Interrupts
+    @property
+    def interrupt_status(self) -> Tuple[bool, bool, bool]:
+        """Tuple indicating which of the sensor's engines have raised an interrupt.
+
+        1. Proximity Interrupt (``STATUS<PINT>``)
+        2. Color/Light Interrupt (``STATUS<AINT>``)
+        3. Gesture Interrupt (``STATUS<GINT>``)
+
+        If an ``interrupt_pin`` was passed to the driver, the sensor is only read while that pin
+        is asserted. While it isn't, ``(False, False, False)`` is returned without any I2C
+        traffic, so this can be checked in a tight loop without keeping the bus busy.
+
+        .. code-block:: python
+
+            apds = APDS9960(i2c, interrupt_pin=int_pin)
+            apds.enable_proximity_interrupt = True
+            apds.enable_proximity = True
+
+            while True:
+                proximity_int, color_int, gesture_int = apds.interrupt_status
+                if proximity_int:
+                    print(apds.proximity)
+                    apds.clear_interrupt()
+
+        .. note:: Interrupts only assert the sensor's ``INT`` pin if they are enabled, e.g. via
+           `enable_proximity_interrupt` or `enable_color_interrupt`. Interrupts that are not
+           enabled are still reported here when no ``interrupt_pin`` was given.
+        """
+        pin = self._interrupt_pin
+        if pin is not None and pin.value:
+            return (False, False, False)
+        status = self._read8(_APDS9960_STATUS)
+        return (
+            bool(status & _BIT_MASK_STATUS_PINT),
+            bool(status & _BIT_MASK_STATUS_AINT),
+            bool(status & _BIT_MASK_STATUS_GINT),
+        )
+
     ## Gesture Properties
     @property
     def enable_gesture(self) -> bool:
@@ -436,6 +614,214 @@ class APDS9960:
     def gesture_gain(self, value: int) -> None:
         self._set_bits(_APDS9960_GCONF2, _BIT_POS_GCONF2_GGAIN, _BIT_MASK_GCONF2_GGAIN, value)
 
+    @property
+    def gesture_fifo_threshold(self) -> int:
+        """Number of datasets that need to be in the gesture FIFOs before the gesture interrupt is
+        raised.
+
+        `gesture()`, `gesture_poll()` and `gesture_trajectory()` only start retrieving data once
+        this interrupt is raised, and from then on retrieve everything that is queued with each
+        I2C transaction. Higher thresholds mean fewer, larger transactions at the cost of a
+        slightly later start.
+
+        .. csv-table::
+           :header: "``gesture_fifo_threshold``", "Datasets", "Note"
+
+           0, 1, "Power-on Default"
+           1, 4, ""
+           2, 8, "Driver Default"
+           3, 16, ""
+        """
+        return self._get_bits(_APDS9960_GCONF1, _BIT_POS_GCONF1_GFIFOTH, _BIT_MASK_GCONF1_GFIFOTH)
+
+    @gesture_fifo_threshold.setter
+    def gesture_fifo_threshold(self, value: int) -> None:
+        self._set_bits(_APDS9960_GCONF1, _BIT_POS_GCONF1_GFIFOTH, _BIT_MASK_GCONF1_GFIFOTH, value)
+
+    @property
+    def gesture_wait_time(self) -> int:
+        """Time the gesture engine waits between each gesture dataset it collects.
+
+        Longer wait times fill the gesture FIFOs more slowly and lower power usage, at the cost of
+        fewer datasets per gesture.
+
+        .. csv-table::
+           :header: "``gesture_wait_time``", "Time", "Note"
+
+           0, "0 ms", "Power-on Default"
+           1, "2.8 ms", "Driver Default"
+           2, "5.6 ms", ""
+           3, "8.4 ms", ""
+           4, "14.0 ms", ""
+           5, "22.4 ms", ""
+           6, "30.8 ms", ""
+           7, "39.2 ms", ""
+        """
+        return self._get_bits(_APDS9960_GCONF2, _BIT_POS_GCONF2_GWTIME, _BIT_MASK_GCONF2_GWTIME)
+
+    @gesture_wait_time.setter
+    def gesture_wait_time(self, value: int) -> None:
+        self._set_bits(_APDS9960_GCONF2, _BIT_POS_GCONF2_GWTIME, _BIT_MASK_GCONF2_GWTIME, value)
+
+    @property
+    def enable_gesture_interrupt(self) -> bool:
+        """If ``True``, the gesture interrupt asserts the sensor's interrupt pin.
+
+        The gesture interrupt is raised once the gesture FIFOs hold at least the number of datasets
+        selected by `gesture_fifo_threshold`: 1, 4, 8 or 16.
+
+        If an ``interrupt_pin`` was passed to the driver, `gesture_poll()` and
+        `gesture_trajectory()` then check that pin instead of the sensor while waiting for a
+        gesture to start, so they cause no I2C traffic at all until there is data to retrieve.
+
+        .. tip:: As with `enable_proximity_interrupt`, using this interrupt will require attaching
+           the sensor's ``INT`` pin to an available digital I/O with a pull-up resistor.
+        """
+        return self._get_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GIEN)
+
+    @enable_gesture_interrupt.setter
+    def enable_gesture_interrupt(self, value: bool) -> None:
+        self._set_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GIEN, value)
+        self._gesture_interrupt = value
+
+    @property
+    def gesture_led_drive(self) -> int:
+        """LED drive strength used during gesture engine operations.
+
+        .. csv-table::
+           :header: "``gesture_led_drive``", "LED Current", "Note"
+
+           0, "100 mA", "Power-on and Driver Default"
+           1, "50 mA", ""
+           2, "25 mA", ""
+           3, "12.5 mA", ""
+        """
+        return self._get_bits(_APDS9960_GCONF2, _BIT_POS_GCONF2_GLDRIVE, _BIT_MASK_GCONF2_GLDRIVE)
+
+    @gesture_led_drive.setter
+    def gesture_led_drive(self, value: int) -> None:
+        self._set_bits(_APDS9960_GCONF2, _BIT_POS_GCONF2_GLDRIVE, _BIT_MASK_GCONF2_GLDRIVE, value)
+
+    @property
+    def gesture_pulse_count(self) -> int:
+        """Number of LED pulses, ``1`` to ``64``, used to collect each gesture dataset.
+
+        More pulses increase range and signal strength, but also power usage and the time taken
+        by each dataset. Defaults to ``6`` with this driver, ``1`` on power-on.
+        """
+        return self._get_bits(_APDS9960_GPULSE, _BIT_POS_GPULSE_GPULSE, _BIT_MASK_GPULSE_GPULSE) + 1
+
+    @gesture_pulse_count.setter
+    def gesture_pulse_count(self, value: int) -> None:
+        if not 1 <= value <= 64:
+            raise ValueError("Gesture pulse count must be between 1 and 64")
+        self._set_bits(_APDS9960_GPULSE, _BIT_POS_GPULSE_GPULSE, _BIT_MASK_GPULSE_GPULSE, value - 1)
+
+    @property
+    def gesture_pulse_length(self) -> int:
+        """Length of each LED pulse used to collect gesture datasets.
+
+        .. csv-table::
+           :header: "``gesture_pulse_length``", "Pulse Length", "Note"
+
+           0, "4 us", ""
+           1, "8 us", "Power-on Default"
+           2, "16 us", "Driver Default"
+           3, "32 us", ""
+        """
+        return self._get_bits(_APDS9960_GPULSE, _BIT_POS_GPULSE_GPLEN, _BIT_MASK_GPULSE_GPLEN)
+
+    @gesture_pulse_length.setter
+    def gesture_pulse_length(self, value: int) -> None:
+        self._set_bits(_APDS9960_GPULSE, _BIT_POS_GPULSE_GPLEN, _BIT_MASK_GPULSE_GPLEN, value)
+
+    @property
+    def gesture_dimensions(self) -> int:
+        """Which photodiode pairs the gesture engine collects data from.
+
+        .. csv-table::
+           :header: "``gesture_dimensions``", "Photodiodes", "Note"
+
+           0, "Up/down and left/right", "Power-on and Driver Default"
+           1, "Up/down only", ""
+           2, "Left/right only", ""
+           3, "Up/down and left/right", ""
+        """
+        return self._get_bits(_APDS9960_GCONF3, _BIT_POS_GCONF3_GDIMS, _BIT_MASK_GCONF3_GDIMS)
+
+    @gesture_dimensions.setter
+    def gesture_dimensions(self, value: int) -> None:
+        self._set_bits(_APDS9960_GCONF3, _BIT_POS_GCONF3_GDIMS, _BIT_MASK_GCONF3_GDIMS, value)
+
+    @property
+    def gesture_offsets(self) -> Tuple[int, int, int, int]:
+        """Tuple of up, down, left and right photodiode offset corrections used by the gesture
+        engine.
+
+        Each value is between ``-127`` and ``127`` and is added to that photodiode's results to
+        compensate for crosstalk, such as light reflected by a cover glass. Defaults to
+        ``(0, 0, 0, 0)``.
+        """
+        return (
+            _decode_offset(self._read8(_APDS9960_GOFFSET_U)),
+            _decode_offset(self._read8(_APDS9960_GOFFSET_D)),
+            _decode_offset(self._read8(_APDS9960_GOFFSET_L)),
+            _decode_offset(self._read8(_APDS9960_GOFFSET_R)),
+        )
+
+    @gesture_offsets.setter
+    def gesture_offsets(self, offsets: Tuple[int, int, int, int]) -> None:
+        with self.batch():
+            self._write8(_APDS9960_GOFFSET_U, _encode_offset(offsets[0]))
+            self._write8(_APDS9960_GOFFSET_D, _encode_offset(offsets[1]))
+            self._write8(_APDS9960_GOFFSET_L, _encode_offset(offsets[2]))
+            self._write8(_APDS9960_GOFFSET_R, _encode_offset(offsets[3]))
+
+    @property
+    def gesture_thresholds(self) -> Tuple[int, int]:
+        """Tuple of the gesture engine's entry and exit thresholds.
+
+        1. Entry Threshold (``GPENTH``): the gesture engine starts once `proximity` is at or
+           above this value.
+        2. Exit Threshold (``GEXTH``): the gesture engine stops once all four gesture photodiodes
+           drop below this value.
+
+        Both can be set to any number between ``0`` and ``255``. The driver defaults to ``(5, 30)``.
+        """
+        return (self._read8(_APDS9960_GPENTH), self._read8(_APDS9960_GEXTH))
+
+    @gesture_thresholds.setter
+    def gesture_thresholds(self, thresholds: Tuple[int, int]) -> None:
+        with self.batch():
+            self._write8(_APDS9960_GPENTH, thresholds[0])
+            self._write8(_APDS9960_GEXTH, thresholds[1])
+
+    def apply_gesture_preset(self, preset: str) -> None:
+        """Tunes the gesture engine for a use case, trading the rate at which the gesture FIFOs
+        fill against range and power usage.
+
+        Each preset sets `gesture_gain`, `gesture_led_drive`, `gesture_pulse_count`,
+        `gesture_pulse_length`, `gesture_wait_time` and `gesture_fifo_threshold`, all written
+        together with `batch`.
+
+        .. csv-table::
+           :header: "Preset", "Gain", "LED Drive", "Pulses", "Pulse Length", "Wait", "Threshold"
+
+           "``default``", 2, 0, 6, 2, 1, 2
+           "``low-latency``", 2, 0, 4, 1, 0, 0
+           "``low-power``", 3, 2, 4, 1, 5, 3
+           "``long-range``", 3, 0, 10, 3, 1, 2
+
+        ``default`` matches the settings applied when the driver is initialized. ``low-latency``
+        collects datasets as quickly as possible and signals the first one right away.
+        ``low-power`` uses less LED current and fewer, shorter pulses, with a long wait between
+        datasets. ``long-range`` uses the strongest LED drive and more, longer pulses.
+
+        :param str preset: One of ``"default"``, ``"low-latency"``, ``"low-power"`` or
+            ``"long-range"``
+        """
+        _gesture_engine().apply_preset(self, preset)
+
     @property
     def rotation(self) -> int:
         """Clock-wise offset to apply to gesture results.
@@ -463,6 +849,9 @@ class APDS9960:
         else:
             raise ValueError("Rotation value must be one of: 0, 90, 180, 270")
 
+        # The gesture engine rotates its lookup table to match on first use
+        self._gesture_table = None
+
     ## Color/Light Properties
     @property
     def enable_color(self) -> bool:
@@ -473,6 +862,23 @@ class APDS9960:
     def enable_color(self, value: bool) -> None:
         self._set_bit(_APDS9960_ENABLE, _BIT_MASK_ENABLE_COLOR, value)
 
+    @property
+    def enable_color_interrupt(self) -> bool:
+        """If ``True``, the internal color/light interrupt asserts the sensor's interrupt pin.
+
+        This driver leaves the color/light interrupt thresholds and persistence at their power-on
+        defaults, which assert the interrupt at the end of every color/light engine run. That makes
+        it a convenient "new `color_data` is ready" signal. Clear it with `clear_interrupt`.
+
+        .. tip:: As with `enable_proximity_interrupt`, using this interrupt will require attaching
+           the sensor's ``INT`` pin to an available digital I/O with a pull-up resistor.
+        """
+        return self._get_bit(_APDS9960_ENABLE, _BIT_MASK_ENABLE_COLOR_INT)
+
+    @enable_color_interrupt.setter
+    def enable_color_interrupt(self, value: bool) -> None:
+        self._set_bit(_APDS9960_ENABLE, _BIT_MASK_ENABLE_COLOR_INT, value)
+
     @property
     def color_data_ready(self) -> int:
         """Color data ready flag.
@@ -514,6 +920,7 @@ class APDS9960:
     @color_gain.setter
     def color_gain(self, value: int) -> None:
         self._set_bits(_APDS9960_CONTROL, _BIT_POS_CONTROL_AGAIN, _BIT_MASK_CONTROL_AGAIN, value)
+        self._color_settings += 1
 
     @property
     def color_integration_time(self) -> int:
@@ -537,6 +944,7 @@ class APDS9960:
     @color_integration_time.setter
     def color_integration_time(self, value: int) -> None:
         self._write8(_APDS9960_ATIME, 256 - value)
+        self._color_settings += 1
 
     ## PROXIMITY
     @property
@@ -612,152 +1020,108 @@ class APDS9960:
            As a result, if an object is close to the sensor when `gesture()` is called, the method
            will not return until it moves away.
 
-        .. note:: The sensor itself offers a very wide variety of configuration options for tuning
-           the gesture engine, such as the LEDs (pulse count/length, drive power), the photosensors
-           (gain, offsets, masking), the gesture engine's entry/exit thresholds, wait time, and
-           more. However, this driver does not make those readily available in order to keep file
-           size and memory footprint to a minimum, which is critical for its use on more
-           constrained platforms."""
-        # If FIFOs have overflowed we're already way too late, so clear those FIFOs and wait
-        if self._get_bit(_APDS9960_GSTATUS, _BIT_MASK_GSTATUS_GFOV):
-            self._set_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GFIFO_CLR, True)
-            wait_cycles = 0
-            # Don't wait forever though, just enough to see if a gesture is happening
-            while not self._get_bit(_APDS9960_STATUS, _BIT_MASK_STATUS_GINT) and wait_cycles <= 30:
-                time.sleep(0.003)
-                wait_cycles += 1
+        .. note:: The gesture engine can be tuned with `gesture_gain`, `gesture_led_drive`,
+           `gesture_pulse_count`, `gesture_pulse_length`, `gesture_offsets`,
+           `gesture_dimensions`, `gesture_thresholds`, `gesture_wait_time` and
+           `gesture_fifo_threshold`, or all at once with `apply_gesture_preset`."""
+        return _gesture_engine().read(self)
+
+    def gesture_poll(self) -> int:
+        """Non-blocking alternative to `gesture()`.
+
+        Each call retrieves whatever gesture data the sensor has collected since the previous
+        call, without ever sleeping, and returns a gesture code once a gesture has ended. Until
+        then, and whenever no gesture is in progress, it returns ``0``. The codes and the use of
+        `rotation` are the same as for `gesture()`.
+
+        A gesture is considered to have ended once no new data has arrived for 30 ms, the same
+        amount of time `gesture()` waits for.
+
+        .. code-block:: python
+
+            while True:
+                gesture = apds.gesture_poll()
+                if gesture:
+                    print(gesture)
+                update_display()
+
+        .. tip:: Call this as often as possible. While no gesture is in progress each call costs a
+           single I2C transaction. If the sensor's FIFOs overflow between calls, the oldest data
+           is lost but the gesture in progress is still tracked.
+        """
+        return _gesture_engine().poll(self)
+
+    def gesture_trajectory(self) -> int:
+        """Non-blocking gesture detection that uses every gesture dataset.
+
+        Works like `gesture_poll()`, returning the same gesture codes, but instead of only
+        comparing the first and last useful datasets it follows the whole path of the gesture.
+        Every dataset is folded into running sums as it arrives, using constant memory, to track
+        the trend of the up/down and left/right ratios and when each of the four photodiodes saw
+        its strongest signal.
+
+        A gesture is reported as soon as the trajectory is unambiguous: one axis has clearly
+        changed more than the other, its trend is strong enough, and both of its photodiodes have
+        peaked in the order matching that trend. This is usually well before the hand has left
+        the sensor. Otherwise the gesture is decided from the overall trends once it has ended,
+        and ``0`` is returned if neither axis changed enough.
 
-        # Only start retrieval if there are datasets to retrieve
-        frame = []
-        datasets_available = self._read8(_APDS9960_GFLVL)
-        if self._get_bit(_APDS9960_STATUS, _BIT_MASK_STATUS_GINT) and datasets_available > 0:
-            if not self.buf129:
-                self.buf129 = bytearray(129)
+        Only one gesture is reported per gesture engine run, and only the first 64 useful datasets
+        of a run are used.
+
+        .. note:: Use either this or `gesture_poll()`, not both, since they share the tracking of
+           whether a gesture is in progress.
+        """
+        return _gesture_engine().trajectory(self)
+
+    def gesture_datasets(self) -> Iterator[Tuple[memoryview, float, int]]:
+        """Generator over the raw datasets currently held in the sensor's gesture FIFOs.
+
+        Yields a tuple for each dataset containing:
+
+        1. A 4 byte `memoryview` of the up, down, left and right values, each ``0`` to ``255``
+        2. The timestamp of when the FIFOs were read, from the driver's ``clock``
+        3. The number of datasets that were in the FIFOs when they were read (``GFLVL``)
+
+        The FIFOs are emptied with as few I2C transactions as possible, and the generator stops
+        once they are empty, so it never blocks waiting for a gesture. Nothing is filtered or
+        rotated, which makes this useful for logging gesture data or running other gesture
+        detection algorithms.
+
+        .. code-block:: python
+
+            while True:
+                for dataset, timestamp, level in apds.gesture_datasets():
+                    up, down, left, right = dataset
+                    print(timestamp, level, up, down, left, right)
+
+        .. caution:: Each `memoryview` points into the driver's internal FIFO buffer and is only
+           valid until the next I2C FIFO read, including by `gesture()` or `gesture_poll()`. Copy
+           it with ``bytes(dataset)`` to keep it.
+
+        .. caution:: Will not yield anything if `enable_proximity` and `enable_gesture` are not
+           set to ``True``.
+        """
+        return _gesture_engine().datasets(self)
 
-            buffer = self.buf129
-            buffer[0] = _APDS9960_GFIFO_U
+    @property
+    def gesture_stats(self) -> "GestureStats":
+        """`~adafruit_apds9960.gesture.GestureStats` tracking how the gesture FIFOs are being used.
 
-            if not self.buf4:
-                self.buf4 = bytearray(4)
+        Statistics are only collected from the first time this is accessed, so there is no cost
+        for code that doesn't use them.
 
-            buffer_dataset = self.buf4
+        .. code-block:: python
 
-            # Retrieve new data until our FIFOs are truly empty
+            stats = apds.gesture_stats
             while True:
-                dataset_count = self._read8(_APDS9960_GFLVL)
-                if dataset_count == 0:
-                    break
-
-                with self.i2c_device as i2c:
-                    i2c.write_then_readinto(
-                        buffer,
-                        buffer,
-                        out_end=1,
-                        in_start=1,
-                        in_end=min(129, 1 + (dataset_count * 4)),
-                    )
-
-                # Unpack data stream into more usable U/D/L/R datasets for analysis
-                idx = 0
-                for i in range(dataset_count):
-                    rec = i + 1
-                    idx = 1 + ((rec - 1) * 4)
-
-                    buffer_dataset[0] = buffer[idx]
-                    buffer_dataset[1] = buffer[idx + 1]
-                    buffer_dataset[2] = buffer[idx + 2]
-                    buffer_dataset[3] = buffer[idx + 3]
-
-                    # Drop fully-saturated and fully-zero to conserve memory
-                    # Filter to remove useless (saturated, empty, low-count) datasets
-                    if (
-                        (not all(val == 255 for val in buffer_dataset))
-                        and (not all(val == 0 for val in buffer_dataset))
-                        and (all(val >= 30 for val in buffer_dataset))
-                    ):
-                        if len(frame) < 2:
-                            frame.append(tuple(buffer_dataset))
-                        else:
-                            frame[1] = tuple(buffer_dataset)
-
-                # Wait a very short time to see if new FIFO data has arrived before we drop out
-                time.sleep(0.03)
-
-        # If we only got one useful frame, that's not enough to make a solid guess
-        if len(frame) < 2:
-            return 0
-
-        # We should have a dataframe with two tuples now, a "first" and "last" entry.
-        # Time to process the dataframe!
-
-        # Determine our up/down and left/right ratios along with our first/last deltas
-        f_r_ud = ((frame[0][0] - frame[0][1]) * 100) // (frame[0][0] + frame[0][1])
-        f_r_lr = ((frame[0][2] - frame[0][3]) * 100) // (frame[0][2] + frame[0][3])
-
-        l_r_ud = ((frame[1][0] - frame[1][1]) * 100) // (frame[1][0] + frame[1][1])
-        l_r_lr = ((frame[1][2] - frame[1][3]) * 100) // (frame[1][2] + frame[1][3])
-
-        delta_ud = l_r_ud - f_r_ud
-        delta_lr = l_r_lr - f_r_lr
-
-        # Make our first guess at what gesture we saw, if any
-        state_ud = 0
-        state_lr = 0
-
-        if delta_ud >= 30:
-            state_ud = 1
-        elif delta_ud <= -30:
-            state_ud = -1
-
-        if delta_lr >= 30:
-            state_lr = 1
-        elif delta_lr <= -30:
-            state_lr = -1
-
-        # Make our final decision based on our first guess and, if required, the delta data
-        gesture_found = 0
-
-        # Easy cases
-        if state_ud == -1 and state_lr == 0:
-            gesture_found = 1
-        elif state_ud == 1 and state_lr == 0:
-            gesture_found = 2
-        elif state_ud == 0 and state_lr == -1:
-            gesture_found = 3
-        elif state_ud == 0 and state_lr == 1:
-            gesture_found = 4
-
-        # Not so easy cases
-        if gesture_found == 0:
-            if state_ud == -1 and state_lr == 1:
-                if abs(delta_ud) > abs(delta_lr):
-                    gesture_found = 1
-                else:
-                    gesture_found = 4
-            elif state_ud == 1 and state_lr == -1:
-                if abs(delta_ud) > abs(delta_lr):
-                    gesture_found = 2
-                else:
-                    gesture_found = 3
-            elif state_ud == -1 and state_lr == -1:
-                if abs(delta_ud) > abs(delta_lr):
-                    gesture_found = 1
-                else:
-                    gesture_found = 3
-            elif state_ud == 1 and state_lr == 1:
-                if abs(delta_ud) > abs(delta_lr):
-                    gesture_found = 2
-                else:
-                    gesture_found = 3
-
-        if gesture_found != 0:
-            if self._rotation != 0:
-                # If we need to rotate our gesture, lets do that before returning
-                dir_lookup = [1, 4, 2, 3]
-                idx = (dir_lookup.index(gesture_found) + self._rotation // 90) % 4
-                return dir_lookup[idx]
-
-        return gesture_found
+                gesture = apds.gesture_poll()
+                ...
+                self._clock.sleep(stats.recommended_poll_interval)
+        """
+        if self._gesture_stats is None:
+            self._gesture_stats = _gesture_engine().GestureStats(self._clock)
+        return self._gesture_stats
 
     ## COLOR
     @property
@@ -767,6 +1131,9 @@ class APDS9960:
 
         Each value is a 16-bit integer with a possible value of ``0`` to ``65535``.
 
+        All four channels are read in a single I2C transaction, so they always come from the same
+        color/light engine run.
+
         .. caution:: Will always return ``(0, 0, 0, 0)`` if `enable_color` is not set to ``True``.
 
         .. tip:: To get useful, predictable `color_data` results it is important to tune
@@ -783,16 +1150,221 @@ class APDS9960:
            difusion glass or plastic is likely to require experimenting with a wide range of
            `color_gain` and `color_integration_time` settings before useful data can be obtained.
         """
+        # Read CDATAL through BDATAH in one auto-incrementing transaction so all four channels
+        # come from the same color/light engine run
+        buf = self.buf10
+        buf[0] = _APDS9960_CDATAL
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_end=8)
+        return (
+            buf[3] << 8 | buf[2],
+            buf[5] << 8 | buf[4],
+            buf[7] << 8 | buf[6],
+            buf[1] << 8 | buf[0],
+        )
+
+    ## SNAPSHOT
+    def read_snapshot(self) -> Tuple[bool, bool, bool, bool, Tuple[int, int, int, int], int]:
+        """Reads the status, color and proximity registers in a single I2C transaction.
+
+        ``STATUS``, the four color data registers and ``PDATA`` are adjacent in the sensor's
+        register map, so this retrieves all of them with one burst read instead of the separate
+        transactions needed by `color_data_ready`, `color_data` and `proximity`.
+
+        Returns a tuple containing:
+
+        1. Color data valid (``STATUS<AVALID>``)
+        2. Proximity data valid (``STATUS<PVALID>``)
+        3. Clear photodiode saturated (``STATUS<CPSAT>``)
+        4. Proximity/gesture saturated (``STATUS<PGSAT>``)
+        5. Red, green, blue, and clear values, in the same format as `color_data`
+        6. Proximity value, in the same format as `proximity`
+
+        .. note:: As with `color_data`, reading the color data registers resets the color data
+           valid flag on the sensor.
+        """
+        buf = self.buf10
+        buf[0] = _APDS9960_STATUS
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1)
+        status = buf[0]
         return (
-            self._color_data16(_APDS9960_CDATAL + 2),
-            self._color_data16(_APDS9960_CDATAL + 4),
-            self._color_data16(_APDS9960_CDATAL + 6),
-            self._color_data16(_APDS9960_CDATAL),
+            bool(status & _BIT_MASK_STATUS_AVALID),
+            bool(status & _BIT_MASK_STATUS_PVALID),
+            bool(status & _BIT_MASK_STATUS_CPSAT),
+            bool(status & _BIT_MASK_STATUS_PGSAT),
+            (
+                buf[4] << 8 | buf[3],
+                buf[6] << 8 | buf[5],
+                buf[8] << 8 | buf[7],
+                buf[2] << 8 | buf[1],
+            ),
+            buf[9],
         )
 
+    def resync(self) -> None:
+        """Refreshes the RAM copy of the configuration registers from the sensor.
+
+        Only needed when the sensor may have been reconfigured outside of this driver, for example
+        by another driver instance or by a power cycle, and either the driver was created with
+        ``cache=True`` or a `~adafruit_apds9960.colorutility.ColorCalibration` is bound to it.
+        Bound calibrations read the color settings again the next time they are used.
+        """
+        self._color_settings += 1
+        shadow = self._shadow
+        if shadow is None:
+            return
+        if not self.buf16:
+            self.buf16 = bytearray(16)
+        buf = self.buf16
+        for start, length in _SHADOW_BLOCKS:
+            buf[0] = start
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(buf, buf, out_end=1, in_end=length)
+            for register in shadow:
+                if start <= register < start + length:
+                    shadow[register] = buf[register - start]
+
+    def batch(self) -> "_BatchWrite":
+        """Context manager that queues register writes and sends them together on exit.
+
+        Inside the ``with`` block, changes made through the driver's properties are held in RAM
+        instead of being sent to the sensor right away, and repeated changes to the same register
+        are merged. When the block exits, the queued values are written in register order, with
+        each run of adjacent registers sent as a single burst write. ``ENABLE`` is always written
+        last, so any engine turned on inside the block starts with the rest of its new settings
+        already in place.
+
+        .. code-block:: python
+
+            with apds.batch():
+                apds.enable_color = False
+                apds.enable_proximity = True
+                apds.enable_gesture = True
+                apds.gesture_gain = 3
+
+        .. note:: Reading a property inside the block returns the queued value. Setters still need
+           to read a register from the sensor the first time they change part of it, unless the
+           driver was created with ``cache=True``. `clear_interrupt` and all data reads are not
+           queued and happen immediately.
+        """
+        return _BatchWrite(self)
+
+    def _flush_pending(self) -> None:
+        """Writes all queued register values using as few burst writes as possible, leaving
+        ``ENABLE`` until last"""
+        pending = self._pending
+        self._pending = None
+        enable = pending.pop(_APDS9960_ENABLE, None)
+        registers = sorted(pending)
+        start = 0
+        while start < len(registers):
+            end = start + 1
+            while end < len(registers) and registers[end] == registers[end - 1] + 1:
+                end += 1
+            buf = bytearray(1 + end - start)
+            buf[0] = registers[start]
+            for i in range(start, end):
+                buf[1 + i - start] = pending[registers[i]]
+            with self.i2c_device as i2c:
+                i2c.write(buf)
+            start = end
+        if enable is not None:
+            self._write8(_APDS9960_ENABLE, enable)
+
+    def _poll_bit(self, register: int, mask: int, value: bool, timeout: float) -> None:
+        """Reads a single bit directly from the I2C device's register, bypassing any cached or
+        queued value, until it matches ``value`` or ``timeout`` seconds have passed"""
+        buf = self.buf2
+        deadline = self._clock.monotonic() + timeout
+        while True:
+            buf[0] = register
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(buf, buf, out_end=1, in_end=1)
+            if bool(buf[0] & mask) == value or self._clock.monotonic() >= deadline:
+                return
+
+    ## ASYNCIO
+    async def gesture_async(self, poll_interval: float = 0.005) -> int:
+        """Waits for a gesture without blocking other `asyncio` tasks.
+
+        Uses `gesture_poll()`, yielding to the event loop for ``poll_interval`` seconds between
+        polls, and returns the gesture code once a gesture has been detected.
+
+        :param float poll_interval: Time to yield between polls, in seconds. Defaults to
+            :const:`0.005`
+        """
+        import asyncio  # noqa: PLC0415, only load asyncio when it is used
+
+        while True:
+            gesture_found = self.gesture_poll()
+            if gesture_found:
+                return gesture_found
+            await asyncio.sleep(poll_interval)
+
+    async def color_data_async(self, poll_interval: float = 0.005) -> Tuple[int, int, int, int]:
+        """Waits for new `color_data` without blocking other `asyncio` tasks.
+
+        Each poll checks the color data valid flag and reads the color data in the same I2C
+        transaction, yielding to the event loop for ``poll_interval`` seconds while no new data is
+        available.
+
+        :param float poll_interval: Time to yield between polls, in seconds. Defaults to
+            :const:`0.005`
+        """
+        import asyncio  # noqa: PLC0415, only load asyncio when it is used
+
+        while True:
+            snapshot = self.read_snapshot()
+            if snapshot[0]:
+                return snapshot[4]
+            await asyncio.sleep(poll_interval)
+
+    async def proximity_async(self, poll_interval: float = 0.005) -> int:
+        """Waits for a new `proximity` value without blocking other `asyncio` tasks.
+
+        Yields to the event loop for ``poll_interval`` seconds while the proximity engine has no
+        new data available.
+
+        :param float poll_interval: Time to yield between polls, in seconds. Defaults to
+            :const:`0.005`
+        """
+        import asyncio  # noqa: PLC0415, only load asyncio when it is used
+
+        while not self._get_bit(_APDS9960_STATUS, _BIT_MASK_STATUS_PVALID):
+            await asyncio.sleep(poll_interval)
+        return self._read8(_APDS9960_PDATA)
+
+    def color_stream(self, poll_interval: float = 0.005) -> "_SampleStream":
+        """Asynchronous iterator over new `color_data` samples, using `color_data_async`.
+
+        .. code-block:: python
+
+            async for r, g, b, c in apds.color_stream():
+                print(r, g, b, c)
+        """
+        return _SampleStream(self.color_data_async, poll_interval)
+
+    def proximity_stream(self, poll_interval: float = 0.005) -> "_SampleStream":
+        """Asynchronous iterator over new `proximity` values, using `proximity_async`.
+
+        .. code-block:: python
+
+            async for proximity in apds.proximity_stream():
+                print(proximity)
+        """
+        return _SampleStream(self.proximity_async, poll_interval)
+
     # method for reading and writing to I2C
     def _write8(self, command: int, abyte: int) -> None:
         """Write a command and 1 byte of data to the I2C device"""
+        shadow = self._shadow
+        if shadow is not None and command in shadow:
+            shadow[command] = abyte
+        pending = self._pending
+        if pending is not None:
+            pending[command] = abyte
+            return
         buf = self.buf2
         buf[0] = command
         buf[1] = abyte
@@ -808,6 +1380,12 @@ class APDS9960:
 
     def _read8(self, command: int) -> int:
         """Sends a command and reads 1 byte of data from the I2C device"""
+        pending = self._pending
+        if pending is not None and command in pending:
+            return pending[command]
+        shadow = self._shadow
+        if shadow is not None and command in shadow:
+            return shadow[command]
         buf = self.buf2
         buf[0] = command
         with self.i2c_device as i2c:
@@ -816,48 +1394,80 @@ class APDS9960:
 
     def _get_bit(self, register: int, mask: int) -> bool:
         """Gets a single bit value from the I2C device's register"""
-        buf = self.buf2
-        buf[0] = register
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
-        return bool(buf[1] & mask)
+        return bool(self._read8(register) & mask)
 
     def _set_bit(self, register: int, mask: int, value: bool) -> None:
         """Sets a single bit value in the I2C device's register"""
-        buf = self.buf2
-        buf[0] = register
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
         if value:
-            buf[1] |= mask
+            self._write8(register, self._read8(register) | mask)
         else:
-            buf[1] &= ~mask
-        with self.i2c_device as i2c:
-            i2c.write(buf, end=2)
+            self._write8(register, self._read8(register) & ~mask)
 
     def _get_bits(self, register: int, pos: int, mask: int) -> int:
         """Sets a multi-bit value in the I2C device's register"""
-        buf = self.buf2
-        buf[0] = register
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
-        return (buf[1] & mask) >> pos
+        return (self._read8(register) & mask) >> pos
 
     def _set_bits(self, register: int, pos: int, mask: int, value: int) -> None:
         """Sets a multi-bit value in the I2C device's register"""
-        buf = self.buf2
-        buf[0] = register
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
-        buf[1] = (buf[1] & ~mask) | (value << pos)
-        with self.i2c_device as i2c:
-            i2c.write(buf, end=2)
+        self._write8(register, (self._read8(register) & ~mask) | (value << pos))
 
-    def _color_data16(self, command: int) -> int:
-        """Sends a command and reads 2 bytes of data from the I2C device
-        The returned data is low byte first followed by high byte"""
-        buf = self.buf2
-        buf[0] = command
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(buf, buf, out_end=1)
-        return buf[1] << 8 | buf[0]
+
+def _gesture_engine():
+    """Imports the gesture engine on first use, so code that only uses color or proximity never
+    loads it"""
+    from adafruit_apds9960 import gesture  # noqa: PLC0415, only load it when it is used
+
+    return gesture
+
+
+def _decode_offset(value: int) -> int:
+    """Converts a sign-magnitude gesture offset register value to an int"""
+    if value & 0x80:
+        return -(value & 0x7F)
+    return value
+
+
+def _encode_offset(offset: int) -> int:
+    """Converts an int to a sign-magnitude gesture offset register value"""
+    if not -127 <= offset <= 127:
+        raise ValueError("Gesture offsets must be between -127 and 127")
+    if offset < 0:
+        return 0x80 | -offset
+    return offset
+
+
+class _BatchWrite:
+    """Context manager returned by :meth:`APDS9960.batch`"""
+
+    def __init__(self, apds: APDS9960):
+        self._apds = apds
+
+    def __enter__(self) -> APDS9960:
+        apds = self._apds
+        if apds._batch_depth == 0:
+            apds._pending = {}
+        apds._batch_depth += 1
+        return apds
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        apds = self._apds
+        apds._batch_depth -= 1
+        if apds._batch_depth == 0:
+            # Flush even when an exception was raised, matching what unbatched writes would do
+            apds._flush_pending()
+        return False
+
+
+class _SampleStream:
+    """Asynchronous iterator returned by :meth:`APDS9960.color_stream` and
+    :meth:`APDS9960.proximity_stream`"""
+
+    def __init__(self, read_async, poll_interval: float):
+        self._read_async = read_async
+        self._poll_interval = poll_interval
+
+    def __aiter__(self) -> "_SampleStream":
+        return self
+
+    async def __anext__(self):
+        return await self._read_async(self._poll_interval)
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`autorange`
+====================================================
+
+Automatic color gain and integration time control for the APDS9960, so color readings stay
+useful as the light level changes from sunlight to darkness.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from adafruit_apds9960.colorutility import _COLOR_GAINS
+
+try:
+    # Only used for typing
+    from typing import Optional, Sequence, Tuple
+
+    from adafruit_apds9960.apds9960 import APDS9960
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_APDS9960.git"
+
+# (color_gain, color_integration_time) steps from least to most sensitive. Gain is raised before
+# integration time, so samples only take longer once the light is too dim for the highest gain
+_DEFAULT_LADDER = (
+    (0, 10),  # 1x, 27.8 ms
+    (1, 10),  # 4x, 27.8 ms
+    (2, 10),  # 16x, 27.8 ms
+    (3, 10),  # 64x, 27.8 ms
+    (3, 37),  # 64x, 103 ms
+    (3, 72),  # 64x, 200 ms
+    (3, 256),  # 64x, 712 ms
+)
+
+
+class AutoRange:
+    """Adjusts an `APDS9960`'s `APDS9960.color_gain` and `APDS9960.color_integration_time` to
+    keep its color readings within a target window.
+
+    Each sample's largest channel is compared to the full scale count of the current settings.
+    When it is below ``low`` or above ``high`` of full scale, the controller moves to the most
+    sensitive step of ``ladder`` that is predicted to bring it to no more than the middle of the
+    window. Samples within the window never cause a change, so the settings don't flip back and
+    forth around a threshold.
+
+    A saturated sample, where ``STATUS<CPSAT>`` is set or a channel reached full scale, says
+    nothing about how bright the light is, so the controller then drops to the least sensitive
+    step and moves up from there once it has a usable sample.
+
+    The first sample after each change is discarded, as it may have been partly integrated with
+    the previous settings.
+
+    Checking for a new sample takes a single I2C transaction, using `APDS9960.read_snapshot`.
+
+    :param ~adafruit_apds9960.apds9960.APDS9960 apds: The sensor to control. `enable_color` has
+        to be turned on separately.
+    :param ladder: ``(color_gain, color_integration_time)`` tuples, ordered from least to most
+        sensitive. Defaults to 1x to 64x gain at 27.8 ms, followed by 64x gain at 103 ms, 200 ms
+        and 712 ms
+    :param float low: Fraction of full scale below which the sensitivity is raised.
+        Defaults to ``0.1``
+    :param float high: Fraction of full scale above which the sensitivity is lowered.
+        Defaults to ``0.8``
+
+    :ivar bool saturated: True if the last sample was saturated, which only happens when the
+        light is too bright even for the least sensitive step
+
+    .. code-block:: python
+
+        from adafruit_apds9960.autorange import AutoRange
+        from adafruit_apds9960.colorutility import ColorCalibration
+
+        apds.enable_color = True
+        autorange = AutoRange(apds)
+        calibration = ColorCalibration(apds)
+        while True:
+            print(calibration.lux(autorange.read()))
+    """
+
+    def __init__(
+        self,
+        apds: APDS9960,
+        *,
+        ladder: Sequence[Tuple[int, int]] = _DEFAULT_LADDER,
+        low: float = 0.1,
+        high: float = 0.8,
+    ):
+        if not 0 < low < high <= 1:
+            raise ValueError("low and high must be fractions, with low below high")
+        self._apds = apds
+        self._ladder = ladder
+        self._low = low
+        self._high = high
+        self._target = (low + high) / 2
+        self._sensitivity = [_COLOR_GAINS[gain] * cycles for gain, cycles in ladder]
+        self._full_scale = [min(65535, 1024 * cycles + 1) for _, cycles in ladder]
+        self._step = None
+        self._discard = False
+        self._poll_interval = 0.005
+        self.saturated = False
+        self.step = 0
+
+    @property
+    def step(self) -> int:
+        """Index of the current settings in the ladder. Setting it applies those settings."""
+        return self._step
+
+    @step.setter
+    def step(self, index: int) -> None:
+        gain, cycles = self._ladder[index]
+        if self._step is None or gain != self._ladder[self._step][0]:
+            self._apds.color_gain = gain
+        if self._step is None or cycles != self._ladder[self._step][1]:
+            self._apds.color_integration_time = cycles
+        self._step = index
+        self._discard = True
+        # Check for new samples four times per integration cycle
+        self._poll_interval = max(0.005, cycles * 0.00278 / 4)
+
+    def update(self) -> Optional[Tuple[int, int, int, int]]:
+        """Checks for a new sample, adjusting the settings if needed.
+
+        Returns the red, green, blue, and clear values, in the same format as
+        `APDS9960.color_data`, if a new sample is ready and was taken with settings that didn't
+        need changing, or with the least or most sensitive settings if those aren't enough.
+        Returns ``None`` otherwise."""
+        valid, _, saturated, _, color, _ = self._apds.read_snapshot()
+        if not valid:
+            return None
+
+        step = self._step
+        full_scale = self._full_scale[step]
+        peak = max(color)
+        saturated = saturated or peak >= full_scale
+        if saturated:
+            # CPSAT stays set until it is cleared
+            self._apds.clear_color_interrupt()
+        if self._discard:
+            self._discard = False
+            return None
+
+        self.saturated = saturated
+        if saturated:
+            target_step = 0
+        elif self._low * full_scale <= peak <= self._high * full_scale:
+            target_step = step
+        else:
+            target_step = self._target_step(peak)
+        if target_step == step:
+            return color
+        self.step = target_step
+        return None
+
+    def _target_step(self, peak: int) -> int:
+        """The most sensitive step at which ``peak`` is predicted to be no more than the middle of
+        the window"""
+        target_step = 0
+        current = self._sensitivity[self._step]
+        for i, sensitivity in enumerate(self._sensitivity):
+            if peak * sensitivity / current <= self._target * self._full_scale[i]:
+                target_step = i
+        return target_step
+
+    def read(self) -> Tuple[int, int, int, int]:
+        """Waits for the next sample returned by `update`, and returns it.
+
+        Only checks for new samples a few times per integration cycle, so waiting through long
+        integration times doesn't keep the I2C bus busy."""
+        while True:
+            color = self.update()
+            if color is not None:
+                return color
+            time.sleep(self._poll_interval)
@@ -11,9 +11,34 @@ Helper functions for color calculations
 * Author(s): Michael McWethy
 """
 
+import math
+from array import array
+
+try:
+    # Only used for typing
+    from typing import Optional, Sequence, Tuple, Union
+
+    SampleColumn = Union[Sequence[int], array, "numpy.ndarray"]
+except ImportError:
+    pass
+
+try:
+    # Only used for typing. Kept separate so the conversions still import without the driver's
+    # dependencies, such as when post-processing logged samples on a computer
+    from adafruit_apds9960.apds9960 import APDS9960
+except ImportError:
+    pass
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_APDS9960.git"
 
+# Gain multiplier of each APDS9960.color_gain setting, also used by autorange and simulator
+_COLOR_GAINS = (1, 4, 16, 64)
+
+# Range of the n value ColorTemperatureTable covers
+_TABLE_N_MIN = -1.25
+_TABLE_N_MAX = 4.0
+
 
 def calculate_color_temperature(r: int, g: int, b: int) -> float:
     """Converts the raw R/G/B values to color temperature in degrees Kelvin"""
@@ -47,3 +72,286 @@ def calculate_lux(r: int, g: int, b: int) -> float:
     illuminance = (-0.32466 * r) + (1.57837 * g) + (-0.73191 * b)
 
     return illuminance
+
+
+def calculate_color_temperature_batch(r: SampleColumn, g: SampleColumn, b: SampleColumn):
+    """Converts many raw R/G/B values to color temperatures in degrees Kelvin at once.
+
+    ``r``, ``g`` and ``b`` are equal length sequences, `array.array` buffers or NumPy arrays,
+    such as the columns of a log of `APDS9960.color_data` samples. Each result is the same as
+    `calculate_color_temperature` would give for that sample, except that samples it can't
+    convert, such as complete darkness, give ``nan`` instead of raising an exception.
+
+    When NumPy is installed the conversion is vectorized and a NumPy array is returned. Otherwise
+    each sample is converted in turn and an `array.array` of ``"d"`` is returned.
+    """
+    numpy = _get_numpy()
+    if numpy is None:
+        result = array("d")
+        for i in range(len(r)):
+            try:
+                cct = calculate_color_temperature(r[i], g[i], b[i])
+            except (ZeroDivisionError, OverflowError):
+                cct = math.nan
+            result.append(cct if math.isfinite(cct) else math.nan)
+        return result
+
+    r = numpy.asarray(r, dtype=numpy.float64)
+    g = numpy.asarray(g, dtype=numpy.float64)
+    b = numpy.asarray(b, dtype=numpy.float64)
+    # Same steps as calculate_color_temperature
+    x = (-0.14282 * r) + (1.54924 * g) + (-0.95641 * b)
+    y = (-0.32466 * r) + (1.57837 * g) + (-0.73191 * b)
+    z = (-0.68202 * r) + (0.77073 * g) + (0.56332 * b)
+    with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        xchrome = x / (x + y + z)
+        ychrome = y / (x + y + z)
+        n = (xchrome - 0.3320) / (0.1858 - ychrome)
+        cct = (449.0 * n**3) + (3525.0 * n**2) + (6823.3 * n) + 5520.33
+    return numpy.where(numpy.isfinite(cct), cct, numpy.nan)
+
+
+def calculate_lux_batch(r: SampleColumn, g: SampleColumn, b: SampleColumn):
+    """Calculates ambient light values for many raw R/G/B values at once.
+
+    Takes and returns the same types as `calculate_color_temperature_batch`, with each result the
+    same as `calculate_lux` would give for that sample.
+    """
+    numpy = _get_numpy()
+    if numpy is None:
+        result = array("d")
+        for i in range(len(r)):
+            result.append(calculate_lux(r[i], g[i], b[i]))
+        return result
+
+    r = numpy.asarray(r, dtype=numpy.float64)
+    g = numpy.asarray(g, dtype=numpy.float64)
+    b = numpy.asarray(b, dtype=numpy.float64)
+    return (-0.32466 * r) + (1.57837 * g) + (-0.73191 * b)
+
+
+def _get_numpy():
+    """Returns the NumPy module, or ``None`` if it isn't installed"""
+    try:
+        import numpy  # noqa: PLC0415, only load NumPy when it is used
+    except ImportError:
+        return None
+    return numpy
+
+
+def calculate_color_temperature_int(r: int, g: int, b: int) -> int:
+    """Integer-only version of `calculate_color_temperature`, for boards without a floating point
+    unit.
+
+    Takes the same 16-bit R/G/B values as `calculate_color_temperature`, and keeps every
+    intermediate value below 2 ** 30, so no long integers are ever created either. The result is
+    rounded to the nearest degree Kelvin.
+
+    Agrees with `calculate_color_temperature` within 3 K or 0.1%, whichever is larger, as long as
+    its intermediate ``n`` value is between ``-4`` and ``4``. That covers every color temperature
+    from 1700 K to over 100000 K. Outside that range ``n`` is clamped, so the result stays bounded
+    instead of growing without limit.
+
+    Raises `ZeroDivisionError` when the chromaticity can't be calculated, such as in complete
+    darkness.
+    """
+    # The chromaticity steps of calculate_color_temperature simplify to
+    # n = (X - 0.3320 * (X + Y + Z)) / (0.1858 * (X + Y + Z) - Y),
+    # with the coefficients of both sides combined and scaled by 2 ** 14. The numerator is often
+    # much smaller than its terms, so the rounding left over is added back at 2 ** 24.
+    num, num_exponent = _to_mantissa(3913 * r + 4178 * g - 9550 * b, -278 * r - 231 * g - 407 * b)
+    den, den_exponent = _to_mantissa(1820 * r - 13993 * g + 8567 * b, -18 * r + 109 * g - 53 * b)
+
+    # n with 12 fractional bits, clamped to -4 to 4
+    n = (num << 12) // den
+    shift = num_exponent - den_exponent
+    while shift > 0 and -16384 <= n <= 16384:
+        n <<= 1
+        shift -= 1
+    if shift < 0:
+        n >>= -shift
+    n = max(-16384, min(16384, n))
+
+    # The CCT polynomial, in Horner form with 12 fractional bits
+    cct = 449 * n + 14438400
+    cct = _multiply_q12(cct, n) + 27948237
+    cct = _multiply_q12(cct, n) + 22611272
+    return (cct + 2048) >> 12
+
+
+def calculate_lux_int(r: int, g: int, b: int) -> int:
+    """Integer-only version of `calculate_lux`, for boards without a floating point unit.
+
+    Takes the same 16-bit R/G/B values as `calculate_lux`, and keeps every intermediate value
+    below 2 ** 30. The result is rounded to the nearest whole number, and is within
+    ``(r + g + b) / 16384 + 0.5`` of `calculate_lux`, so at most 13 away.
+    """
+    # calculate_lux coefficients scaled by 2 ** 13
+    return (-2660 * r + 12930 * g - 5996 * b + 4096) >> 13
+
+
+def _to_mantissa(high: int, low: int) -> "Tuple[int, int]":
+    """Combines ``high``, scaled by 2 ** 14, and ``low``, scaled by 2 ** 24, into a mantissa
+    below 2 ** 18 and the number of bits it was shifted right by"""
+    if -(1 << 19) < high < 1 << 19:
+        mantissa = (high << 10) + low
+        exponent = 0
+    else:
+        mantissa = high + (low >> 10)
+        exponent = 10
+    while mantissa >= 1 << 18 or mantissa < -(1 << 18):
+        mantissa >>= 1
+        exponent += 1
+    return mantissa, exponent
+
+
+def _multiply_q12(a: int, b: int) -> int:
+    """``(a * b) >> 12`` for a ``b`` with 12 fractional bits, without the product ever reaching
+    2 ** 30 as long as ``a`` is below 2 ** 27 and ``b`` below 2 ** 14"""
+    return (a >> 12) * b + (((a & 0xFFF) * b) >> 12)
+
+
+class ColorCalibration:
+    """Converts raw `APDS9960.color_data` values to lux and color temperature, taking the sensor's
+    current `APDS9960.color_gain` and `APDS9960.color_integration_time` and the infrared light seen
+    by the clear channel into account.
+
+    Uses the method from the `AMS DN40 application note
+    <https://ams.com/documents/20143/36005/LightSensors_AN000170_2-00.pdf>`_. The infrared
+    component ``IR = (R + G + B - C) / 2`` is removed from each color channel before they are
+    combined, and lux are then scaled by the counts per lux the current settings give.
+
+    The scale factors are only recalculated after ``color_gain`` or ``color_integration_time``
+    were changed through the driver, or `APDS9960.resync` was called, so converting samples
+    doesn't read anything from the sensor.
+
+    :param ~adafruit_apds9960.apds9960.APDS9960 apds: The sensor the samples come from
+    :param float glass_attenuation: DN40's glass attenuation factor (GA) for any glass or plastic in
+        front of the sensor: one divided by the fraction of light it lets through, so ``1.0`` or
+        more. For example ``2.0`` for a cover that lets half of the light through, which doubles
+        the lux. Defaults to ``1.0``, for an uncovered sensor
+
+    .. code-block:: python
+
+        from adafruit_apds9960.colorutility import ColorCalibration
+
+        calibration = ColorCalibration(apds)
+        color = apds.color_data
+        print(calibration.lux(color), calibration.color_temperature(color))
+    """
+
+    def __init__(self, apds: "APDS9960", *, glass_attenuation: float = 1.0):
+        self._apds = apds
+        if glass_attenuation < 1:
+            raise ValueError("glass_attenuation is 1 / transmission, so at least 1.0")
+        self._glass_attenuation = glass_attenuation
+        self._settings = None  # APDS9960 color settings counter the scale was calculated for
+        self._lux_scale = 0.0
+
+    def lux(self, color: Tuple[int, int, int, int]) -> float:
+        """Converts a red, green, blue, and clear tuple, as returned by `APDS9960.color_data`, to
+        lux. Results are only meaningful while none of the channels is saturated."""
+        if self._settings != self._apds._color_settings:
+            self._update_scale()
+        r, g, b, c = color
+        ir = (r + g + b - c) / 2
+        return (0.136 * (r - ir) + (g - ir) - 0.444 * (b - ir)) * self._lux_scale
+
+    @staticmethod
+    def color_temperature(color: Tuple[int, int, int, int]) -> float:
+        """Converts a red, green, blue, and clear tuple, as returned by `APDS9960.color_data`, to
+        color temperature in degrees Kelvin.
+
+        Raises `ZeroDivisionError` when there is no red light left once the infrared component is
+        removed, such as in complete darkness."""
+        r, g, b, c = color
+        ir = (r + g + b - c) / 2
+        return 3810 * (b - ir) / (r - ir) + 1391
+
+    def _update_scale(self) -> None:
+        """Recalculates the lux per count for the sensor's current settings"""
+        apds = self._apds
+        self._settings = apds._color_settings
+        integration_ms = apds.color_integration_time * 2.78
+        gain = _COLOR_GAINS[apds.color_gain]
+        # Device factor of 310 from DN40
+        self._lux_scale = self._glass_attenuation * 310 / (integration_ms * gain)
+
+
+class ColorTemperatureTable:
+    """Estimates color temperature from raw R/G/B values with a precomputed lookup table, which is
+    cheaper than the polynomial in `calculate_color_temperature` on most boards.
+
+    The table holds the color temperature at ``size`` evenly spaced values of the polynomial's
+    ``n`` input, from ``-1.25`` (about 1620 K) to ``4.0`` (about 118000 K), where the polynomial
+    only increases. Values of ``n`` outside that range use the nearest end of the table, so
+    chromaticities where the polynomial blows up, such as a ``ychrome`` close to ``0.1858``, give
+    a bounded result instead of an exception.
+
+    Within that range, the interpolated estimate is within 0.9% of `calculate_color_temperature`
+    for a table of 32 entries, and each doubling of the size divides the error by four, to 0.2%
+    for 64 entries and 0.05% for 128. Without interpolation each doubling only halves the error,
+    starting from 11% for 32 entries.
+
+    :param int size: Number of entries in the table, at least ``2``. Each takes 4 bytes.
+        Defaults to ``64``
+    :param bool interpolate: If true, interpolate linearly between the two nearest entries.
+        Otherwise use the nearest entry, which is a little faster but much less accurate.
+        Defaults to :const:`True`
+    :param float fallback: Returned when there is no chromaticity to estimate from, such as in
+        complete darkness. Defaults to :const:`None`
+
+    .. code-block:: python
+
+        from adafruit_apds9960.colorutility import ColorTemperatureTable
+
+        table = ColorTemperatureTable(size=32, fallback=6500)
+        r, g, b, _ = apds.color_data
+        print(table.color_temperature(r, g, b))
+    """
+
+    def __init__(
+        self, size: int = 64, *, interpolate: bool = True, fallback: Optional[float] = None
+    ):
+        if size < 2:
+            raise ValueError("size must be at least 2")
+        step = (_TABLE_N_MAX - _TABLE_N_MIN) / (size - 1)
+        self._table = array(
+            "f",
+            (_cct_polynomial(_TABLE_N_MIN + i * step) for i in range(size)),
+        )
+        self._per_step = 1 / step
+        self._last = size - 1
+        self._interpolate = interpolate
+        self.fallback = fallback
+        """Value returned when there is no chromaticity to estimate from"""
+
+    def color_temperature(self, r: int, g: int, b: int) -> Optional[float]:
+        """Converts the raw R/G/B values to color temperature in degrees Kelvin"""
+        # The chromaticity steps of calculate_color_temperature simplify to
+        # n = (X - 0.3320 * (X + Y + Z)) / (0.1858 * (X + Y + Z) - Y)
+        numerator = 0.238814 * r + 0.25499112 * g - 0.58291 * b
+        denominator = 0.1110829 * r - 0.854058428 * g + 0.522885 * b
+        if denominator:
+            position = (numerator / denominator - _TABLE_N_MIN) * self._per_step
+        elif numerator:
+            # n is infinite, so use the end of the table n is heading towards
+            position = self._last if numerator > 0 else 0
+        else:
+            return self.fallback
+
+        last = self._last
+        if position <= 0:
+            return self._table[0]
+        if position >= last:
+            return self._table[last]
+        if not self._interpolate:
+            return self._table[int(position + 0.5)]
+        index = int(position)
+        below = self._table[index]
+        return below + (self._table[index + 1] - below) * (position - index)
+
+
+def _cct_polynomial(n: float) -> float:
+    """The CCT polynomial of calculate_color_temperature, in Horner form"""
+    return ((449.0 * n + 3525.0) * n + 6823.3) * n + 5520.33
@@ -0,0 +1,538 @@
+# SPDX-FileCopyrightText: 2017 Michael McWethy for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`gesture`
+====================================================
+
+Gesture engine for the APDS9960 driver.
+
+The `APDS9960` gesture methods import this module the first time they are called, so code that
+only uses color or proximity never loads it. There is no need to import it directly, other than
+to use `GestureStats`.
+
+* Author(s): Michael McWethy, Erik Hess
+"""
+
+import time
+
+from micropython import const
+
+try:
+    # Only used for typing
+    from typing import Iterator, Tuple
+
+    from adafruit_apds9960.apds9960 import APDS9960
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_APDS9960.git"
+
+_APDS9960_STATUS = const(0x93)
+_APDS9960_GCONF4 = const(0xAB)
+_APDS9960_GFLVL = const(0xAE)
+_APDS9960_GFIFO_U = const(0xFC)
+
+_BIT_MASK_STATUS_GINT = const(0x04)
+_BIT_MASK_GSTATUS_GFOV = const(0x02)
+_BIT_MASK_GCONF4_GFIFO_CLR = const(0x04)
+
+# gesture_gain, gesture_led_drive, gesture_pulse_count, gesture_pulse_length, gesture_wait_time
+# and gesture_fifo_threshold for each of the apply_gesture_preset() presets
+_GESTURE_PRESETS = {
+    "default": (2, 0, 6, 2, 1, 2),
+    "low-latency": (2, 0, 4, 1, 0, 0),
+    "low-power": (3, 2, 4, 1, 5, 3),
+    "long-range": (3, 0, 10, 3, 1, 2),
+}
+
+# Gesture codes for each combination of up/down movement (up, none, down), left/right movement
+# (left, none, right) and whether the left/right axis (even index) or the up/down axis (odd index)
+# changed the most
+_GESTURE_TABLE = b"\x03\x01\x01\x01\x04\x01\x03\x03\x00\x00\x04\x04\x03\x02\x02\x02\x03\x02"
+# Gesture codes in clockwise order (up, right, down, left), and each code's position in that order
+_GESTURE_CLOCKWISE = b"\x01\x04\x02\x03"
+_GESTURE_CLOCKWISE_INDEX = b"\x00\x00\x02\x03\x01"
+
+
+def read(apds: APDS9960) -> int:
+    """Implements :meth:`APDS9960.gesture`"""
+    # GFLVL and GSTATUS are adjacent, so get both in one transaction
+    buf = apds.buf2
+    buf[0] = _APDS9960_GFLVL
+    with apds.i2c_device as i2c:
+        i2c.write_then_readinto(buf, buf, out_end=1)
+    dataset_count = buf[0]
+
+    # If FIFOs have overflowed we're already way too late, so clear those FIFOs and wait
+    if buf[1] & _BIT_MASK_GSTATUS_GFOV:
+        if apds._gesture_stats is not None:
+            apds._gesture_stats.overflowed()
+        apds._set_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GFIFO_CLR, True)
+        wait_cycles = 0
+        # Don't wait forever though, just enough to see if a gesture is happening
+        while not apds._get_bit(_APDS9960_STATUS, _BIT_MASK_STATUS_GINT) and wait_cycles <= 30:
+            apds._clock.sleep(0.003)
+            wait_cycles += 1
+        dataset_count = apds._read8(_APDS9960_GFLVL)
+
+    # Only start retrieval if there are datasets to retrieve
+    if not apds.buf9:
+        apds.buf9 = bytearray(9)
+    frame = apds.buf9
+    frame[0] = 0
+    if dataset_count > 0 and apds._get_bit(_APDS9960_STATUS, _BIT_MASK_STATUS_GINT):
+        # Retrieve new data until our FIFOs are truly empty, draining everything that is
+        # queued with each read
+        while dataset_count:
+            _read_fifo(apds, dataset_count, frame)
+
+            # Wait a very short time to see if new FIFO data has arrived before we drop out
+            apds._clock.sleep(0.03)
+            dataset_count = apds._read8(_APDS9960_GFLVL)
+
+    return _decode(apds, frame)
+
+
+def poll(apds: APDS9960) -> int:
+    """Implements :meth:`APDS9960.gesture_poll`"""
+    if apds._gesture_frame is None:
+        apds._gesture_frame = bytearray(9)
+    frame = apds._gesture_frame
+
+    dataset_count = _poll_fifo(apds)
+    if dataset_count < 0:
+        return 0
+
+    if dataset_count:
+        _read_fifo(apds, dataset_count, frame)
+        apds._gesture_last_data = apds._clock.monotonic()
+        return 0
+
+    if not _timed_out(apds):
+        return 0
+
+    # The gesture is over, decide what it was and get ready for the next one
+    gesture_found = _decode(apds, frame)
+    frame[0] = 0
+    return gesture_found
+
+
+def trajectory(apds: APDS9960) -> int:
+    """Implements :meth:`APDS9960.gesture_trajectory`"""
+    if apds._trajectory is None:
+        apds._trajectory = _GestureTrajectory()
+    state = apds._trajectory
+
+    dataset_count = _poll_fifo(apds)
+    if dataset_count < 0:
+        return 0
+
+    if dataset_count:
+        in_end = _read_fifo_raw(apds, dataset_count)
+        apds._gesture_last_data = apds._clock.monotonic()
+        if state.decided:
+            return 0
+
+        buffer = apds.buf129
+        dropped = 0
+        for idx in range(1, in_end, 4):
+            u = buffer[idx]
+            d = buffer[idx + 1]
+            l = buffer[idx + 2]
+            r = buffer[idx + 3]
+
+            # Same filter as _read_fifo
+            if (
+                u < 30
+                or d < 30
+                or l < 30
+                or r < 30
+                or (u == 255 and d == 255 and l == 255 and r == 255)
+            ):
+                dropped += 1
+                continue
+
+            state.add(u, d, l, r)
+
+        if apds._gesture_stats is not None:
+            apds._gesture_stats.datasets_dropped += dropped
+
+        gesture_found = _decide_trajectory(apds, state, True)
+        if gesture_found:
+            state.decided = True
+        return gesture_found
+
+    if not _timed_out(apds):
+        return 0
+
+    # The gesture is over, use the whole trajectory if we haven't decided yet
+    gesture_found = 0
+    if not state.decided:
+        gesture_found = _decide_trajectory(apds, state, False)
+    state.reset()
+    return gesture_found
+
+
+def datasets(apds: APDS9960) -> Iterator[Tuple[memoryview, float, int]]:
+    """Implements :meth:`APDS9960.gesture_datasets`"""
+    view = None
+    while True:
+        dataset_count = apds._read8(_APDS9960_GFLVL)
+        if dataset_count == 0:
+            return
+
+        in_end = _read_fifo_raw(apds, dataset_count)
+        timestamp = apds._clock.monotonic()
+        if view is None:
+            view = memoryview(apds.buf129)
+
+        for idx in range(1, in_end, 4):
+            yield view[idx : idx + 4], timestamp, dataset_count
+
+
+def apply_preset(apds: APDS9960, preset: str) -> None:
+    """Implements :meth:`APDS9960.apply_gesture_preset`"""
+    if preset not in _GESTURE_PRESETS:
+        raise ValueError("Gesture preset must be one of: " + ", ".join(_GESTURE_PRESETS))
+    gain, led_drive, pulse_count, pulse_length, wait_time, threshold = _GESTURE_PRESETS[preset]
+    with apds.batch():
+        apds.gesture_gain = gain
+        apds.gesture_led_drive = led_drive
+        apds.gesture_pulse_count = pulse_count
+        apds.gesture_pulse_length = pulse_length
+        apds.gesture_wait_time = wait_time
+        apds.gesture_fifo_threshold = threshold
+
+
+def _poll_fifo(apds: APDS9960) -> int:
+    """First step of the non-blocking gesture decoders.
+
+    Returns ``-1`` if no gesture is in progress, otherwise the number of datasets waiting in the
+    gesture FIFOs. Overflowed FIFOs are cleared and reported as empty."""
+    # Wait for the gesture engine to signal new data before starting to track a gesture
+    if apds._gesture_last_data is None:
+        pin = apds._interrupt_pin
+        if apds._gesture_interrupt and pin is not None:
+            if pin.value:
+                return -1
+        elif not apds._get_bit(_APDS9960_STATUS, _BIT_MASK_STATUS_GINT):
+            return -1
+        apds._gesture_last_data = apds._clock.monotonic()
+
+    # GFLVL and GSTATUS are adjacent, so get both in one transaction
+    buf = apds.buf2
+    buf[0] = _APDS9960_GFLVL
+    with apds.i2c_device as i2c:
+        i2c.write_then_readinto(buf, buf, out_end=1)
+    if buf[1] & _BIT_MASK_GSTATUS_GFOV:
+        if apds._gesture_stats is not None:
+            apds._gesture_stats.overflowed()
+        apds._set_bit(_APDS9960_GCONF4, _BIT_MASK_GCONF4_GFIFO_CLR, True)
+        return 0
+    return buf[0]
+
+
+def _timed_out(apds: APDS9960) -> bool:
+    """Returns ``True``, and stops tracking the gesture, once no new gesture data has arrived for
+    30 ms"""
+    if apds._clock.monotonic() - apds._gesture_last_data < 0.03:
+        return False
+    apds._gesture_last_data = None
+    return True
+
+
+def _read_fifo_raw(apds: APDS9960, dataset_count: int) -> int:
+    """Reads ``dataset_count`` datasets from the gesture FIFOs into ``buf129`` with a single burst
+    read, returning the end index of the data in the buffer"""
+    if not apds.buf129:
+        apds.buf129 = bytearray(129)
+
+    buffer = apds.buf129
+    buffer[0] = _APDS9960_GFIFO_U
+
+    in_end = min(129, 1 + (dataset_count * 4))
+    with apds.i2c_device as i2c:
+        i2c.write_then_readinto(buffer, buffer, out_end=1, in_start=1, in_end=in_end)
+    if apds._gesture_stats is not None:
+        apds._gesture_stats.drained(dataset_count)
+    return in_end
+
+
+def _read_fifo(apds: APDS9960, dataset_count: int, frame: bytearray) -> None:
+    """Retrieves ``dataset_count`` datasets from the gesture FIFOs, keeping the first and last
+    useful datasets in ``frame``.
+
+    ``frame[0]`` holds how many datasets have been kept so far (at most 2), followed by the
+    U/D/L/R values of the first dataset at ``frame[1:5]`` and of the last at ``frame[5:9]``.
+    Everything is done in place so no memory is allocated."""
+    in_end = _read_fifo_raw(apds, dataset_count)
+    buffer = apds.buf129
+
+    # Walk the U/D/L/R datasets directly in the FIFO buffer
+    dropped = 0
+    for idx in range(1, in_end, 4):
+        u = buffer[idx]
+        d = buffer[idx + 1]
+        l = buffer[idx + 2]
+        r = buffer[idx + 3]
+
+        # Filter to remove useless (saturated, empty, low-count) datasets
+        if (
+            u < 30
+            or d < 30
+            or l < 30
+            or r < 30
+            or (u == 255 and d == 255 and l == 255 and r == 255)
+        ):
+            dropped += 1
+            continue
+
+        # Fill the "first" dataset, then keep overwriting the "last" one
+        if frame[0] < 2:
+            frame[0] += 1
+        slot = frame[0] * 4 - 3
+        frame[slot] = u
+        frame[slot + 1] = d
+        frame[slot + 2] = l
+        frame[slot + 3] = r
+
+    if apds._gesture_stats is not None:
+        apds._gesture_stats.datasets_dropped += dropped
+
+
+def _decode(apds: APDS9960, frame: bytearray) -> int:
+    """Determines the gesture code from a "first" and "last" dataset frame, as filled in by
+    `_read_fifo`"""
+    # If we only got one useful frame, that's not enough to make a solid guess
+    if frame[0] < 2:
+        return 0
+
+    # We should have a dataframe with a "first" and "last" entry.
+    # Time to process the dataframe!
+
+    # Determine our up/down and left/right ratios along with our first/last deltas
+    f_r_ud = ((frame[1] - frame[2]) * 100) // (frame[1] + frame[2])
+    f_r_lr = ((frame[3] - frame[4]) * 100) // (frame[3] + frame[4])
+
+    l_r_ud = ((frame[5] - frame[6]) * 100) // (frame[5] + frame[6])
+    l_r_lr = ((frame[7] - frame[8]) * 100) // (frame[7] + frame[8])
+
+    delta_ud = l_r_ud - f_r_ud
+    delta_lr = l_r_lr - f_r_lr
+
+    return _classify(apds, delta_ud, delta_lr)
+
+
+def _classify(apds: APDS9960, delta_ud: int, delta_lr: int) -> int:
+    """Determines the gesture code from the change in the up/down and left/right ratios"""
+    # Each axis is moving one way or the other if its ratio changed by at least 30
+    index = 0
+    if delta_ud >= 30:
+        index = 12
+    elif delta_ud > -30:
+        index = 6
+
+    if delta_lr >= 30:
+        index += 4
+    elif delta_lr > -30:
+        index += 2
+
+    # Let the dominant axis decide between diagonal moves
+    if abs(delta_ud) > abs(delta_lr):
+        index += 1
+
+    # Rotate the lookup table once per rotation, rather than every detected gesture
+    table = apds._gesture_table
+    if table is None:
+        steps = apds.rotation // 90
+        table = bytearray(_GESTURE_TABLE)
+        for i, gesture_found in enumerate(table):
+            if gesture_found:
+                clockwise_index = _GESTURE_CLOCKWISE_INDEX[gesture_found] + steps
+                table[i] = _GESTURE_CLOCKWISE[clockwise_index % 4]
+        apds._gesture_table = table
+    return table[index]
+
+
+def _decide_trajectory(apds: APDS9960, state: "_GestureTrajectory", early: bool) -> int:
+    """Determines the gesture code from a gesture's trajectory, or ``0`` if there isn't one.
+
+    If ``early``, the gesture may still be in progress so only unambiguous trajectories are
+    decided."""
+    count = state.count
+    if count < 2:
+        return 0
+
+    change_ud = state.change(state.sum_ud, state.sum_tud)
+    change_lr = state.change(state.sum_lr, state.sum_tlr)
+    if not early:
+        return _classify(apds, change_ud, change_lr)
+
+    if count < 4:
+        return 0
+    if abs(change_ud) >= 30 and abs(change_ud) >= 2 * abs(change_lr):
+        if state.peaked_in_order(0, 1, change_ud, count):
+            return _classify(apds, change_ud, 0)
+    elif abs(change_lr) >= 30 and abs(change_lr) >= 2 * abs(change_ud):
+        if state.peaked_in_order(2, 3, change_lr, count):
+            return _classify(apds, 0, change_lr)
+    return 0
+
+
+class GestureStats:
+    """Statistics about the use of the APDS9960's gesture FIFOs, available from
+    :attr:`APDS9960.gesture_stats`.
+
+    These help tell whether missed gestures are caused by polling too slowly, in which case
+    ``overflows`` goes up, or by the data itself, in which case ``datasets_dropped`` is high
+    compared to ``datasets_drained``.
+
+    :ivar int overflows: Number of times the gesture FIFOs overflowed and had to be cleared,
+        losing data
+    :ivar int high_water: Largest number of datasets found waiting in the gesture FIFOs
+    :ivar int datasets_drained: Total number of datasets retrieved from the gesture FIFOs
+    :ivar int datasets_dropped: Number of retrieved datasets discarded by the gesture decoders
+        as saturated or too weak to be useful
+    :ivar float fill_rate: Estimated rate at which the gesture FIFOs fill while a gesture is in
+        progress, in datasets per second
+
+    :param clock: Object with a ``monotonic()`` function used to time the FIFO drains, such as
+        the driver's ``clock``. Defaults to :const:`None`, which uses `time`
+    """
+
+    # The FIFOs hold 32 datasets, so aim to drain them when they're about half full
+    TARGET_FILL = 16
+    MIN_POLL_INTERVAL = 0.001
+    MAX_POLL_INTERVAL = 0.1
+
+    def __init__(self, clock=None):
+        self._clock = time if clock is None else clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets all statistics, including the fill rate estimate"""
+        self.overflows = 0
+        self.high_water = 0
+        self.datasets_drained = 0
+        self.datasets_dropped = 0
+        self.fill_rate = 0.0
+        self._last_drain = None
+
+    @property
+    def recommended_poll_interval(self) -> float:
+        """Suggested time between gesture polls, in seconds, based on `fill_rate`.
+
+        Shortens as the gesture FIFOs are seen to fill faster, or overflow, so they are drained
+        when they're about half full. Lengthens again as they fill more slowly, so no more I2C
+        transactions are made than needed. Returns `MAX_POLL_INTERVAL` until a fill rate has been
+        measured.
+        """
+        if self.fill_rate <= 0:
+            return self.MAX_POLL_INTERVAL
+        interval = self.TARGET_FILL / self.fill_rate
+        return max(self.MIN_POLL_INTERVAL, min(self.MAX_POLL_INTERVAL, interval))
+
+    def drained(self, dataset_count: int) -> None:
+        """Records that ``dataset_count`` datasets were retrieved from the gesture FIFOs"""
+        self.datasets_drained += dataset_count
+        self.high_water = max(self.high_water, dataset_count)
+
+        now = self._clock.monotonic()
+        last_drain = self._last_drain
+        self._last_drain = now
+        # Only drains close together belong to the same gesture and say anything about fill rate
+        if last_drain is None or not 0 < now - last_drain < 0.25:
+            return
+        rate = dataset_count / (now - last_drain)
+        if self.fill_rate <= 0:
+            self.fill_rate = rate
+        else:
+            self.fill_rate += (rate - self.fill_rate) / 4
+
+    def overflowed(self) -> None:
+        """Records that the gesture FIFOs overflowed"""
+        self.overflows += 1
+        self.high_water = 32
+        # Data was lost, so the FIFOs fill at least twice as fast as estimated. Without an
+        # estimate, assume they filled up within the longest poll interval
+        self.fill_rate = max(self.fill_rate * 2, 32 / self.MAX_POLL_INTERVAL)
+
+
+class _GestureTrajectory:
+    """Running statistics of a single gesture, used by :meth:`APDS9960.gesture_trajectory`.
+
+    The up/down and left/right ratios of every dataset are folded into least squares sums, and the
+    peak value and time of each photodiode are tracked, all with small integers only."""
+
+    def __init__(self):
+        self.peak = bytearray(4)  # Highest U/D/L/R values seen
+        self.peak_time = bytearray(4)  # Dataset number of each of those peaks
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets the current gesture"""
+        self.count = 0
+        self.decided = False
+        self.sum_t = 0
+        self.sum_tt = 0
+        self.sum_ud = 0
+        self.sum_tud = 0
+        self.sum_lr = 0
+        self.sum_tlr = 0
+        for i in range(4):
+            self.peak[i] = 0
+            self.peak_time[i] = 0
+
+    def add(self, u: int, d: int, l: int, r: int) -> None:
+        """Adds one useful U/D/L/R dataset"""
+        t = self.count
+        # Enough for any swipe, and keeps every sum small enough to avoid long integers
+        if t >= 64:
+            return
+        self.count = t + 1
+
+        ratio_ud = ((u - d) * 100) // (u + d)
+        ratio_lr = ((l - r) * 100) // (l + r)
+        self.sum_t += t
+        self.sum_tt += t * t
+        self.sum_ud += ratio_ud
+        self.sum_tud += t * ratio_ud
+        self.sum_lr += ratio_lr
+        self.sum_tlr += t * ratio_lr
+
+        peak = self.peak
+        peak_time = self.peak_time
+        if u > peak[0]:
+            peak[0] = u
+            peak_time[0] = t
+        if d > peak[1]:
+            peak[1] = d
+            peak_time[1] = t
+        if l > peak[2]:
+            peak[2] = l
+            peak_time[2] = t
+        if r > peak[3]:
+            peak[3] = r
+            peak_time[3] = t
+
+    def change(self, sum_x: int, sum_tx: int) -> int:
+        """How much a ratio changed from the first to the latest dataset, following the least
+        squares line through all of them rather than just the two end points"""
+        count = self.count
+        denominator = count * self.sum_tt - self.sum_t * self.sum_t
+        if not denominator:
+            return 0
+        return ((count * sum_tx - self.sum_t * sum_x) * (count - 1)) // denominator
+
+    def peaked_in_order(self, first: int, second: int, change: int, count: int) -> bool:
+        """Whether both photodiodes of an axis have already peaked, in the order that matches the
+        sign of ``change``. A falling ratio means ``first`` has to peak before ``second``."""
+        first_time = self.peak_time[first]
+        second_time = self.peak_time[second]
+        # The later of the two peaks must not be the newest dataset, which may still be rising
+        if max(first_time, second_time) >= count - 1 or first_time == second_time:
+            return False
+        return (first_time < second_time) == (change < 0)
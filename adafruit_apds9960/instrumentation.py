@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`instrumentation`
+====================================================
+
+Profiling of the I2C transactions an APDS9960 makes, to find out which registers and calls use
+the bus the most.
+
+Attaching an `Instrumentation` swaps the sensor's `~adafruit_bus_device.i2c_device.I2CDevice` for
+one that measures each transaction, and detaching it puts the original back, so the driver runs
+exactly as fast as usual while nothing is attached.
+
+* Author(s): Adafruit Industries
+"""
+
+from adafruit_apds9960.replay import _now_us
+
+try:
+    # Only used for typing
+    from typing import List, Optional, Tuple
+
+    from adafruit_bus_device.i2c_device import I2CDevice
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+
+    from adafruit_apds9960.apds9960 import APDS9960
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_APDS9960.git"
+
+_HISTOGRAM_BUCKETS = 16
+
+
+class Instrumentation:
+    """Collects statistics about the I2C transactions of an `APDS9960`.
+
+    Each transaction is counted against the register it starts at, so for example the gesture
+    FIFO burst reads are counted against ``0xFC``. Writes of a single byte, such as
+    `APDS9960.clear_interrupt`, count as writes to that register.
+
+    To do something else with each transaction, such as logging it, subclass `Instrumentation`
+    and override `record`.
+
+    :param int trace_size: How many of the most recent transactions to keep in `trace`.
+        Defaults to ``32``
+
+    :ivar dict reads: Number of reads of each register, by register address
+    :ivar dict writes: Number of writes to each register, by register address
+    :ivar int bytes: Total bytes written and read, including register addresses
+    :ivar list histogram: Number of transactions by how long they took. Bucket ``0`` counts
+        transactions that took under 1 microsecond, and each bucket ``n`` after it those that took
+        from ``2 ** (n - 1)`` to under ``2 ** n`` microseconds. The last bucket also counts
+        everything slower.
+
+    .. code-block:: python
+
+        from adafruit_apds9960.instrumentation import Instrumentation
+
+        instrumentation = Instrumentation()
+        instrumentation.attach(apds)
+        for _ in range(100):
+            apds.gesture()
+        instrumentation.detach()
+
+        print(instrumentation.reads)
+        print(instrumentation.histogram)
+    """
+
+    def __init__(self, trace_size: int = 32):
+        self._trace = [None] * trace_size
+        self._trace_index = 0
+        self._sensor = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all the statistics and the trace"""
+        self.reads = {}
+        self.writes = {}
+        self.bytes = 0
+        self.histogram = [0] * _HISTOGRAM_BUCKETS
+        for i in range(len(self._trace)):
+            self._trace[i] = None
+        self._trace_index = 0
+
+    def attach(self, sensor: APDS9960) -> None:
+        """Starts collecting statistics about ``sensor``'s transactions"""
+        if self._sensor is not None:
+            raise RuntimeError("Already attached to a sensor")
+        sensor.i2c_device = _InstrumentedI2CDevice(sensor.i2c_device, self)
+        self._sensor = sensor
+
+    def detach(self) -> None:
+        """Stops collecting statistics, putting the sensor back how it was"""
+        if self._sensor is not None:
+            self._sensor.i2c_device = self._sensor.i2c_device.i2c_device
+            self._sensor = None
+
+    @property
+    def trace(self) -> List[Tuple[str, Optional[int], int, int]]:
+        """The most recent transactions, oldest first, as (type, register, bytes, microseconds)
+        tuples. The type is ``"r"`` for reads and ``"w"`` for writes."""
+        trace = self._trace
+        index = self._trace_index
+        return [entry for entry in trace[index:] + trace[:index] if entry is not None]
+
+    def record(self, kind: str, register: Optional[int], length: int, duration: int) -> None:
+        """Called after every transaction while attached.
+
+        :param str kind: ``"r"`` for reads and ``"w"`` for writes
+        :param int register: Register the transaction started at, or ``None`` for reads that
+            didn't write a register address first
+        :param int length: Bytes written and read, including the register address
+        :param int duration: How long the transaction took, in microseconds
+        """
+        counts = self.reads if kind == "r" else self.writes
+        counts[register] = counts.get(register, 0) + 1
+        self.bytes += length
+
+        bucket = 0
+        remaining = duration
+        while remaining and bucket < _HISTOGRAM_BUCKETS - 1:
+            remaining >>= 1
+            bucket += 1
+        self.histogram[bucket] += 1
+
+        if self._trace:
+            self._trace[self._trace_index] = (kind, register, length, duration)
+            self._trace_index = (self._trace_index + 1) % len(self._trace)
+
+
+class _InstrumentedI2CDevice:
+    """Stands in for an `I2CDevice`, passing every transaction to an `Instrumentation`"""
+
+    def __init__(self, i2c_device: I2CDevice, instrumentation: Instrumentation):
+        self.i2c_device = i2c_device
+        self._instrumentation = instrumentation
+
+    def __enter__(self) -> "_InstrumentedI2CDevice":
+        self.i2c_device.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return self.i2c_device.__exit__(exc_type, exc_val, exc_tb)
+
+    def readinto(self, buf: WriteableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Reads into ``buf`` from the device"""
+        if end is None:
+            end = len(buf)
+        began = _now_us()
+        self.i2c_device.readinto(buf, start=start, end=end)
+        self._instrumentation.record("r", None, end - start, _now_us() - began)
+
+    def write(self, buf: ReadableBuffer, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Writes the bytes from ``buf`` to the device"""
+        if end is None:
+            end = len(buf)
+        register = buf[start] if end > start else None
+        began = _now_us()
+        self.i2c_device.write(buf, start=start, end=end)
+        self._instrumentation.record("w", register, end - start, _now_us() - began)
+
+    def write_then_readinto(
+        self,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Writes the bytes from ``out_buffer`` to the device, then reads into ``in_buffer``"""
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        # The driver often reads into the same buffer, so save the register first
+        register = out_buffer[out_start]
+        began = _now_us()
+        self.i2c_device.write_then_readinto(
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self._instrumentation.record(
+            "r", register, out_end - out_start + in_end - in_start, _now_us() - began
+        )
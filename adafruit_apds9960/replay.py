@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`replay`
+====================================================
+
+Record the raw I2C data read from an APDS9960, and replay it later without the sensor attached.
+
+Recordings are a sequence of fixed size 16 byte records. The first record is a header, and each
+following record holds part of the data returned by one I2C read:
+
+* Bytes 0-3: Microseconds since the recording started (little-endian unsigned int). This wraps
+  around to zero every 71.6 minutes, which replaying accounts for, so recordings can be of any
+  length as long as there are no gaps of more than 71 minutes between reads.
+* Byte 4: The register that was read
+* Byte 5: Bytes of data left in this read, including this record's. Reads of more than 10 bytes,
+  such as gesture FIFO bursts, continue in the following records.
+* Bytes 6-15: Up to 10 bytes of data, padded with zeros
+
+Only reads are recorded. Writes made while replaying are accepted and ignored.
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+import time
+
+try:
+    # Only used for typing
+    from typing import BinaryIO, Dict, List, Optional
+
+    from busio import I2C
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_APDS9960.git"
+
+_RECORD = "<IBB10s"
+_RECORD_SIZE = 16
+_HEADER = b"APDS9960REPLAY\x00\x01"
+
+
+def _now_us() -> int:
+    """Microseconds from an arbitrary starting point, using `time.monotonic_ns` where it is
+    available"""
+    try:
+        return time.monotonic_ns() // 1000
+    except AttributeError:
+        return int(time.monotonic() * 1000000)
+
+
+class RecordingI2C:
+    """Wraps an I2C bus, recording the data read from the APDS9960 to a binary stream.
+
+    :param ~busio.I2C i2c: The I2C bus the APDS9960 is connected to
+    :param stream: Binary stream, such as a file opened with ``"wb"``, to write the recording to
+
+    .. code-block:: python
+
+        import board
+        from adafruit_apds9960.apds9960 import APDS9960
+        from adafruit_apds9960.replay import RecordingI2C
+
+        with open("capture.bin", "wb") as capture:
+            apds = APDS9960(RecordingI2C(board.I2C(), capture))
+            apds.enable_proximity = True
+            apds.enable_gesture = True
+            while True:
+                apds.gesture_poll()
+    """
+
+    def __init__(self, i2c: I2C, stream: BinaryIO):
+        self._i2c = i2c
+        self._stream = stream
+        self._start = _now_us()
+        self._record = bytearray(_RECORD_SIZE)
+        stream.write(_HEADER)
+
+    def try_lock(self) -> bool:
+        """Locks the wrapped bus"""
+        return self._i2c.try_lock()
+
+    def unlock(self) -> None:
+        """Unlocks the wrapped bus"""
+        self._i2c.unlock()
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Writes to the wrapped bus, without recording anything"""
+        if end is None:
+            end = len(buffer)
+        self._i2c.writeto(address, buffer, start=start, end=end)
+
+    def readfrom_into(
+        self, address: int, buffer: WriteableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Reads from the wrapped bus, without recording anything"""
+        if end is None:
+            end = len(buffer)
+        self._i2c.readfrom_into(address, buffer, start=start, end=end)
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Reads a register from the wrapped bus, and records the data that was read"""
+        if out_end is None:
+            out_end = len(buffer_out)
+        if in_end is None:
+            in_end = len(buffer_in)
+        # The register has to be saved first since the driver reuses its buffers for both
+        register = buffer_out[out_start]
+        self._i2c.writeto_then_readfrom(
+            address,
+            buffer_out,
+            buffer_in,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        timestamp = (_now_us() - self._start) & 0xFFFFFFFF
+        record = self._record
+        for offset in range(in_start, in_end, 10):
+            chunk = buffer_in[offset : min(offset + 10, in_end)]
+            struct.pack_into(_RECORD, record, 0, timestamp, register, in_end - offset, chunk)
+            self._stream.write(record)
+
+
+class ReplayI2C:
+    """Stands in for an I2C bus, answering reads with the data from a recording made with
+    `RecordingI2C`.
+
+    Each register's recorded reads are returned in order, regardless of the order registers are
+    read in. Once a register's recorded reads run out, it reads as zeros, which the driver sees as
+    no new data, and `finished` is set.
+
+    `ReplayI2C` also keeps a virtual clock, which moves forward to the time each returned read was
+    recorded at and when `sleep` is called. Passing the replay as the driver's ``clock`` makes it
+    use that clock, so recordings replay as fast as they can be processed while the driver's
+    timing still matches the recording.
+
+    :param stream: Binary stream, such as a file opened with ``"rb"``, to read the recording from
+
+    .. code-block:: python
+
+        from adafruit_apds9960.apds9960 import APDS9960
+        from adafruit_apds9960.replay import ReplayI2C
+
+        with open("capture.bin", "rb") as capture:
+            replay = ReplayI2C(capture)
+        apds = APDS9960(replay, reset=False, set_defaults=False, clock=replay)
+        while not replay.finished:
+            gesture = apds.gesture_poll()
+    """
+
+    def __init__(self, stream: BinaryIO):
+        if stream.read(_RECORD_SIZE) != _HEADER:
+            raise ValueError("Not an APDS9960 recording")
+
+        self._reads: Dict[int, List] = {}
+        data = None
+        previous = 0
+        wrapped = 0.0  # Seconds lost to the timestamps wrapping around
+        while True:
+            record = stream.read(_RECORD_SIZE)
+            if len(record) < _RECORD_SIZE:
+                break
+            timestamp, register, left, chunk = struct.unpack(_RECORD, record)
+            if timestamp < previous:
+                wrapped += 4294.967296
+            previous = timestamp
+            if data is None:
+                data = bytearray()
+            data += chunk[: min(left, 10)]
+            if left <= 10:
+                self._reads.setdefault(register, []).append((wrapped + timestamp / 1000000, data))
+                data = None
+        for reads in self._reads.values():
+            reads.reverse()  # So the next read can be popped off the end
+
+        self._now = 0.0
+        self.finished = False
+        """True once a register has been read more times than it was in the recording"""
+
+    def monotonic(self) -> float:
+        """Time on the virtual clock, in seconds since the recording started"""
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """Moves the virtual clock forward without actually sleeping"""
+        self._now += seconds
+
+    @staticmethod
+    def try_lock() -> bool:
+        """Always succeeds, as there is nothing else using the replay"""
+        return True
+
+    def unlock(self) -> None:
+        """Does nothing"""
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Ignores writes"""
+
+    @staticmethod
+    def readfrom_into(
+        address: int, buffer: WriteableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Reads zeros, as only register reads are recorded"""
+        if end is None:
+            end = len(buffer)
+        for i in range(start, end):
+            buffer[i] = 0
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Answers a register read with the next recorded read of that register"""
+        if in_end is None:
+            in_end = len(buffer_in)
+        reads = self._reads.get(buffer_out[out_start])
+        data = b""
+        if reads:
+            timestamp, data = reads.pop()
+            self._now = max(self._now, timestamp)
+        else:
+            self.finished = True
+        for i in range(in_end - in_start):
+            buffer_in[in_start + i] = data[i] if i < len(data) else 0
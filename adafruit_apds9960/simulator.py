@@ -0,0 +1,383 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`simulator`
+====================================================
+
+Software model of the APDS9960's registers, for testing and benchmarking the driver without the
+sensor attached.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from micropython import const
+
+from adafruit_apds9960.colorutility import _COLOR_GAINS
+
+try:
+    # Only used for typing
+    from typing import Callable, Iterable, Optional, Tuple
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_APDS9960.git"
+
+# Only the registers the model does something with, the rest simply store what is written
+_APDS9960_ENABLE = const(0x80)
+_APDS9960_ATIME = const(0x81)
+_APDS9960_AILTL = const(0x84)
+_APDS9960_PILT = const(0x89)
+_APDS9960_PIHT = const(0x8B)
+_APDS9960_CONFIG2 = const(0x90)
+_APDS9960_CONTROL = const(0x8F)
+_APDS9960_ID = const(0x92)
+_APDS9960_STATUS = const(0x93)
+_APDS9960_CDATAL = const(0x94)
+_APDS9960_PDATA = const(0x9C)
+_APDS9960_GCONF1 = const(0xA2)
+_APDS9960_GPULSE = const(0xA6)
+_APDS9960_GCONF4 = const(0xAB)
+_APDS9960_GFLVL = const(0xAE)
+_APDS9960_GSTATUS = const(0xAF)
+_APDS9960_PICLEAR = const(0xE5)
+_APDS9960_CICLEAR = const(0xE6)
+_APDS9960_AICLEAR = const(0xE7)
+_APDS9960_GFIFO_U = const(0xFC)
+
+_BIT_MASK_ENABLE_EN = const(0x01)
+_BIT_MASK_ENABLE_COLOR = const(0x02)
+_BIT_MASK_ENABLE_PROX = const(0x04)
+_BIT_MASK_ENABLE_GESTURE = const(0x40)
+_BIT_MASK_STATUS_AVALID = const(0x01)
+_BIT_MASK_STATUS_PVALID = const(0x02)
+_BIT_MASK_STATUS_GINT = const(0x04)
+_BIT_MASK_STATUS_AINT = const(0x10)
+_BIT_MASK_STATUS_PINT = const(0x20)
+_BIT_MASK_STATUS_CPSAT = const(0x80)
+_BIT_MASK_GSTATUS_GVALID = const(0x01)
+_BIT_MASK_GSTATUS_GFOV = const(0x02)
+_BIT_MASK_GCONF4_GMODE = const(0x01)
+_BIT_MASK_GCONF4_GFIFO_CLR = const(0x04)
+
+_COLOR_ON = const(0x03)  # EN and COLOR
+_PROX_ON = const(0x05)  # EN and PROX
+_GESTURE_ON = const(0x41)  # EN and GESTURE
+
+_BIT_POS_GCONF1_GFIFOTH = const(6)
+_BIT_MASK_CONTROL_AGAIN = const(3)
+
+# Registers the driver can't change
+_READ_ONLY = (
+    _APDS9960_ID,
+    _APDS9960_STATUS,
+    _APDS9960_CDATAL,
+    0x95,
+    0x96,
+    0x97,
+    0x98,
+    0x99,
+    0x9A,
+    0x9B,
+    _APDS9960_PDATA,
+    _APDS9960_GFLVL,
+    _APDS9960_GSTATUS,
+)
+
+_FIFO_SIZE = const(32)
+_GESTURE_THRESHOLDS = (1, 4, 8, 16)
+_CYCLE_TIME = 0.00278  # Seconds per ATIME step
+
+
+class APDS9960Simulator:
+    """Stands in for the I2C bus an APDS9960 is connected to, and answers like the sensor would.
+
+    The simulator models:
+
+    * Powering on and off, and enabling each engine, through the ``ENABLE`` register
+    * Burst reads and writes, which move on to the next register after each byte
+    * Color integration taking as long as the integration time set by ``ATIME``, with the
+      readings scaled by the integration time and the gain in ``CONTROL``, and clipped at
+      the maximum count
+    * The color and proximity valid bits, interrupts and saturation bit in ``STATUS``, with the
+      color valid bit reset by reading the color data
+    * The proximity reading in ``PDATA``
+    * The 32 dataset gesture FIFO, with its level in ``GFLVL``, the valid and overflow bits in
+      ``GSTATUS``, the FIFO threshold, and clearing the FIFO through ``GFIFO_CLR``
+
+    Interrupt persistence, wait times and the gesture engine's entry and exit conditions aren't
+    modelled. Gesture data is added with `add_gesture` or `swipe` instead.
+
+    :param ~Callable clock: Function returning the time in seconds, which sets the pace of color
+        integration. Defaults to `time.monotonic`.
+    :param int address: The I2C address the simulator answers on. Defaults to ``0x39``
+
+    .. code-block:: python
+
+        from adafruit_apds9960.apds9960 import APDS9960
+        from adafruit_apds9960.simulator import APDS9960Simulator
+
+        sensor = APDS9960Simulator()
+        apds = APDS9960(sensor)
+        apds.enable_proximity = True
+        apds.enable_gesture = True
+
+        sensor.swipe(1)
+        print(apds.gesture())  # 1, up
+    """
+
+    def __init__(self, *, clock: Optional[Callable[[], float]] = None, address: int = 0x39):
+        self.address = address
+        self._clock = clock if clock is not None else time.monotonic
+
+        self.registers = bytearray(256)
+        """The register contents, indexed by register address"""
+        registers = self.registers
+        registers[_APDS9960_ATIME] = 0xFF
+        registers[0x83] = 0xFF  # WTIME
+        registers[0x8E] = 0x40  # PPULSE
+        registers[0x8D] = 0x40  # CONFIG1
+        registers[_APDS9960_CONFIG2] = 0x01
+        registers[_APDS9960_ID] = 0xAB
+        registers[_APDS9960_GPULSE] = 0x40
+
+        self.light = (0, 0, 0, 0)
+        """Light reaching the sensor as red, green, blue and clear counts per ATIME step at 1x
+        gain. Counts don't have to be whole numbers."""
+        self.proximity = 0
+        """Proximity reading, from 0 to 255"""
+
+        self._fifo = bytearray()
+        self._color_start = 0.0
+        self._color_cycles = 0
+
+    def add_gesture(self, datasets: Iterable[Tuple[int, int, int, int]]) -> None:
+        """Adds (up, down, left, right) datasets to the gesture FIFO, as long as the gesture
+        engine is enabled. Datasets that don't fit in the FIFO are lost and set the overflow bit
+        in ``GSTATUS``."""
+        registers = self.registers
+        if registers[_APDS9960_ENABLE] & _GESTURE_ON != _GESTURE_ON:
+            return
+        registers[_APDS9960_GCONF4] |= _BIT_MASK_GCONF4_GMODE
+        fifo = self._fifo
+        for dataset in datasets:
+            if len(fifo) >= _FIFO_SIZE * 4:
+                registers[_APDS9960_GSTATUS] |= _BIT_MASK_GSTATUS_GFOV
+                break
+            fifo.extend(bytes(dataset))
+        self._update_gesture()
+
+    def swipe(self, direction: int, datasets: int = 12) -> None:
+        """Adds a simple gesture to the gesture FIFO.
+
+        :param int direction: The gesture, using the same codes as
+            :meth:`~adafruit_apds9960.apds9960.APDS9960.gesture` with a `rotation` of ``0``
+        :param int datasets: How many datasets the gesture lasts for
+        """
+        if not 1 <= direction <= 4:
+            raise ValueError("Direction must be 1, 2, 3 or 4")
+        gesture = []
+        for i in range(datasets):
+            step = i * 140 // max(1, datasets - 1)
+            leading = 200 - step
+            trailing = 60 + step
+            if direction == 1:
+                gesture.append((leading, trailing, 120, 120))
+            elif direction == 2:
+                gesture.append((trailing, leading, 120, 120))
+            elif direction == 3:
+                gesture.append((120, 120, leading, trailing))
+            else:
+                gesture.append((120, 120, trailing, leading))
+        self.add_gesture(gesture)
+
+    @staticmethod
+    def try_lock() -> bool:
+        """Always succeeds, as there is nothing else using the simulator"""
+        return True
+
+    def unlock(self) -> None:
+        """Does nothing"""
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Writes to the registers, starting at the register in the first byte"""
+        self._check_address(address)
+        if end is None:
+            end = len(buffer)
+        if start >= end:
+            return
+
+        register = buffer[start]
+        if end - start == 1:
+            self._command(register)
+        for i in range(start + 1, end):
+            self._write(register, buffer[i])
+            register = (register + 1) & 0xFF
+
+    def readfrom_into(
+        self, address: int, buffer: WriteableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Reads nothing useful, as the driver always starts reads by writing a register"""
+        self._check_address(address)
+        if end is None:
+            end = len(buffer)
+        for i in range(start, end):
+            buffer[i] = 0
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Reads registers, starting at the register in the first byte written"""
+        self._check_address(address)
+        if in_end is None:
+            in_end = len(buffer_in)
+
+        register = buffer_out[out_start]
+        self._update_color()
+        self._update_proximity()
+        registers = self.registers
+        fifo = self._fifo
+        color_read = False
+        for i in range(in_start, in_end):
+            if register >= _APDS9960_GFIFO_U:
+                # Reads in the FIFO wrap around, removing a dataset every four bytes
+                buffer_in[i] = fifo[register - _APDS9960_GFIFO_U] if fifo else 0
+                if register == 0xFF:
+                    fifo[0:4] = b""
+                    self._update_gesture()
+                    register = _APDS9960_GFIFO_U
+                else:
+                    register += 1
+            else:
+                buffer_in[i] = registers[register]
+                color_read = color_read or _APDS9960_CDATAL <= register < _APDS9960_PDATA
+                register = (register + 1) & 0xFF
+        if color_read:
+            # Reading the color data resets AVALID until the next integration cycle finishes
+            registers[_APDS9960_STATUS] &= ~_BIT_MASK_STATUS_AVALID
+
+    def _check_address(self, address: int) -> None:
+        if address != self.address:
+            raise OSError("No device at address " + hex(address))
+
+    def _command(self, register: int) -> None:
+        status = self.registers[_APDS9960_STATUS]
+        if register == _APDS9960_PICLEAR:
+            status &= ~_BIT_MASK_STATUS_PINT
+        elif register == _APDS9960_CICLEAR:
+            status &= ~(_BIT_MASK_STATUS_AINT | _BIT_MASK_STATUS_CPSAT)
+        elif register == _APDS9960_AICLEAR:
+            status &= ~(_BIT_MASK_STATUS_AINT | _BIT_MASK_STATUS_CPSAT | _BIT_MASK_STATUS_PINT)
+        self.registers[_APDS9960_STATUS] = status
+
+    def _write(self, register: int, value: int) -> None:
+        registers = self.registers
+        if register in _READ_ONLY or register >= _APDS9960_GFIFO_U:
+            return
+
+        if register == _APDS9960_ENABLE:
+            self._update_color()
+            enabled = value & ~registers[_APDS9960_ENABLE]
+            disabled = registers[_APDS9960_ENABLE] & ~value
+            registers[_APDS9960_ENABLE] = value
+            if value & _COLOR_ON == _COLOR_ON and enabled & _COLOR_ON:
+                # Color integration starts over whenever it is turned on
+                self._color_start = self._clock()
+                self._color_cycles = 0
+            if disabled & (_BIT_MASK_ENABLE_EN | _BIT_MASK_ENABLE_COLOR):
+                registers[_APDS9960_STATUS] &= ~(_BIT_MASK_STATUS_AVALID | _BIT_MASK_STATUS_CPSAT)
+            if disabled & (_BIT_MASK_ENABLE_EN | _BIT_MASK_ENABLE_PROX):
+                registers[_APDS9960_STATUS] &= ~_BIT_MASK_STATUS_PVALID
+            if disabled & (_BIT_MASK_ENABLE_EN | _BIT_MASK_ENABLE_GESTURE):
+                registers[_APDS9960_GCONF4] &= ~_BIT_MASK_GCONF4_GMODE
+            return
+
+        if register == _APDS9960_GCONF4:
+            # GFIFO_CLR clears itself after emptying the FIFO
+            registers[register] = value & ~_BIT_MASK_GCONF4_GFIFO_CLR
+            if value & _BIT_MASK_GCONF4_GFIFO_CLR:
+                self._fifo = bytearray()
+                registers[_APDS9960_GSTATUS] = 0
+                self._update_gesture()
+            return
+
+        if register in {_APDS9960_ATIME, _APDS9960_CONTROL}:
+            # New color settings take effect from the next integration cycle
+            self._update_color()
+            self._color_start = self._clock()
+            self._color_cycles = 0
+        registers[register] = value
+        if register == _APDS9960_GCONF1:
+            self._update_gesture()
+
+    def _update_color(self) -> None:
+        registers = self.registers
+        if registers[_APDS9960_ENABLE] & _COLOR_ON != _COLOR_ON:
+            return
+
+        steps = 256 - registers[_APDS9960_ATIME]
+        cycles = int((self._clock() - self._color_start) / (steps * _CYCLE_TIME))
+        if cycles <= self._color_cycles:
+            return
+        self._color_cycles = cycles
+
+        # Latch the readings of the integration cycle that just finished
+        gain = _COLOR_GAINS[registers[_APDS9960_CONTROL] & _BIT_MASK_CONTROL_AGAIN]
+        full_scale = min(65535, 1024 * steps + 1)
+        # CPSAT stays set until cleared, like AINT
+        status = registers[_APDS9960_STATUS] | _BIT_MASK_STATUS_AVALID
+        for i, light in enumerate(self.light):
+            count = int(light * steps * gain)
+            if count >= full_scale:
+                count = full_scale
+                if i == 3:
+                    status |= _BIT_MASK_STATUS_CPSAT
+            registers[_APDS9960_CDATAL + 2 * ((i + 1) % 4)] = count & 0xFF
+            registers[_APDS9960_CDATAL + 2 * ((i + 1) % 4) + 1] = count >> 8
+
+        clear = registers[_APDS9960_CDATAL] | registers[_APDS9960_CDATAL + 1] << 8
+        low = registers[_APDS9960_AILTL] | registers[_APDS9960_AILTL + 1] << 8
+        high = registers[_APDS9960_AILTL + 2] | registers[_APDS9960_AILTL + 3] << 8
+        if clear < low or clear > high:
+            status |= _BIT_MASK_STATUS_AINT
+        registers[_APDS9960_STATUS] = status
+
+    def _update_proximity(self) -> None:
+        registers = self.registers
+        if registers[_APDS9960_ENABLE] & _PROX_ON != _PROX_ON:
+            return
+
+        proximity = max(0, min(255, int(self.proximity)))
+        registers[_APDS9960_PDATA] = proximity
+        status = registers[_APDS9960_STATUS] | _BIT_MASK_STATUS_PVALID
+        if proximity < registers[_APDS9960_PILT] or proximity > registers[_APDS9960_PIHT]:
+            status |= _BIT_MASK_STATUS_PINT
+        registers[_APDS9960_STATUS] = status
+
+    def _update_gesture(self) -> None:
+        registers = self.registers
+        level = len(self._fifo) // 4
+        registers[_APDS9960_GFLVL] = level
+        threshold = _GESTURE_THRESHOLDS[registers[_APDS9960_GCONF1] >> _BIT_POS_GCONF1_GFIFOTH]
+        if level >= threshold or registers[_APDS9960_GSTATUS] & _BIT_MASK_GSTATUS_GFOV:
+            registers[_APDS9960_GSTATUS] |= _BIT_MASK_GSTATUS_GVALID
+            registers[_APDS9960_STATUS] |= _BIT_MASK_STATUS_GINT
+        elif not level:
+            registers[_APDS9960_GSTATUS] &= ~_BIT_MASK_GSTATUS_GVALID
+            registers[_APDS9960_STATUS] &= ~_BIT_MASK_STATUS_GINT
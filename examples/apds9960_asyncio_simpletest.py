@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+import board
+
+from adafruit_apds9960.apds9960 import APDS9960
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+apds = APDS9960(i2c)
+apds.enable_proximity = True
+apds.enable_gesture = True
+apds.enable_color = True
+
+# Uncomment and set the rotation if depending on how your sensor is mounted.
+# apds.rotation = 270 # 270 for CLUE
+
+
+async def print_gestures():
+    while True:
+        gesture = await apds.gesture_async()
+        print("gesture", ("up", "down", "left", "right")[gesture - 1])
+
+
+async def print_colors():
+    async for r, g, b, c in apds.color_stream():
+        print(f"red: {r}, green: {g}, blue: {b}, clear: {c}")
+
+
+async def main():
+    await asyncio.gather(print_gestures(), print_colors())
+
+
+asyncio.run(main())
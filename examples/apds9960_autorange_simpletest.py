@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import board
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.autorange import AutoRange
+from adafruit_apds9960.colorutility import ColorCalibration
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+apds = APDS9960(i2c)
+apds.enable_color = True
+
+# Adjusts color_gain and color_integration_time as the light level changes
+autorange = AutoRange(apds)
+# Takes those settings into account when converting to lux
+calibration = ColorCalibration(apds)
+
+while True:
+    color = autorange.read()
+    print(f"gain {apds.color_gain}, integration time {apds.color_integration_time}: {color}")
+    if autorange.saturated:
+        print("too bright, even with the lowest gain and integration time")
+    print(f"light lux {calibration.lux(color)}")
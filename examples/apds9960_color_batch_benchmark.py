@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compares converting a log of color samples one at a time with the batch conversions, which use
+# NumPy when it is installed. Meant to be run on a computer.
+
+import random
+import time
+from array import array
+
+from adafruit_apds9960.colorutility import (
+    calculate_color_temperature,
+    calculate_color_temperature_batch,
+    calculate_lux,
+    calculate_lux_batch,
+)
+
+SAMPLES = 100000
+
+# A made up log of color_data samples, stored as columns
+r = array("H", (random.randint(100, 20000) for _ in range(SAMPLES)))
+g = array("H", (random.randint(100, 20000) for _ in range(SAMPLES)))
+b = array("H", (random.randint(100, 20000) for _ in range(SAMPLES)))
+
+start = time.monotonic()
+for i in range(SAMPLES):
+    try:
+        calculate_color_temperature(r[i], g[i], b[i])
+    except ZeroDivisionError:
+        pass
+    calculate_lux(r[i], g[i], b[i])
+one_at_a_time = time.monotonic() - start
+
+# Leave the one-off NumPy import out of the timing
+calculate_lux_batch(r[:1], g[:1], b[:1])
+
+start = time.monotonic()
+calculate_color_temperature_batch(r, g, b)
+calculate_lux_batch(r, g, b)
+batch = time.monotonic() - start
+
+print(f"one at a time: {one_at_a_time * 1000:.1f} ms for {SAMPLES} samples")
+print(f"batch:         {batch * 1000:.1f} ms for {SAMPLES} samples")
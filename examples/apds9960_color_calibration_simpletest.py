@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+
+import board
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.colorutility import ColorCalibration
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+apds = APDS9960(i2c)
+apds.enable_color = True
+
+# Picks up the gain and integration time changes below without reading them back every sample
+calibration = ColorCalibration(apds)
+
+while True:
+    for gain in range(4):
+        apds.color_gain = gain
+        # The first sample after the change was partly integrated with the previous gain
+        for _ in range(2):
+            while not apds.color_data_ready:
+                time.sleep(0.005)
+            color = apds.color_data
+
+        print(f"gain {gain}: {color}")
+        print(f"light lux {calibration.lux(color)}")
+        print(f"color temp {calibration.color_temperature(color)}")
+        time.sleep(0.5)
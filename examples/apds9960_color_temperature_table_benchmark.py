@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compares the speed and accuracy of color temperature lookup tables of different sizes with the
+# polynomial in calculate_color_temperature. Runs on boards as well as computers.
+
+import random
+import time
+
+from adafruit_apds9960.colorutility import ColorTemperatureTable, calculate_color_temperature
+
+SAMPLES = 1000
+
+# Made up color_data samples of roughly white light, from dim to bright
+samples = []
+for _ in range(SAMPLES):
+    level = random.choice((50, 1000, 20000))
+    samples.append(
+        (
+            level + random.randint(0, level // 10),
+            level + random.randint(0, level // 10),
+            level + random.randint(0, level // 10),
+        )
+    )
+
+start = time.monotonic()
+expected = [calculate_color_temperature(r, g, b) for r, g, b in samples]
+polynomial_time = time.monotonic() - start
+print(f"polynomial:            {polynomial_time * 1000:7.1f} ms for {SAMPLES} samples")
+
+for size in (16, 32, 64, 128):
+    for interpolate in (True, False):
+        table = ColorTemperatureTable(size, interpolate=interpolate)
+        start = time.monotonic()
+        results = [table.color_temperature(r, g, b) for r, g, b in samples]
+        elapsed = time.monotonic() - start
+        error = max(abs(result - cct) / cct for result, cct in zip(results, expected))
+        mode = "interpolated" if interpolate else "nearest"
+        print(
+            f"{size:3} entries, {mode:12}: {elapsed * 1000:7.1f} ms,"
+            + f" largest difference {error * 100:.3f}%"
+        )
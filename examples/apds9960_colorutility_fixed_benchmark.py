@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compares the speed of the floating point and integer-only color conversions, and the largest
+# difference between their results. Runs on boards as well as computers, where the integer
+# versions are mostly useful on boards without a floating point unit.
+
+import random
+import time
+
+from adafruit_apds9960.colorutility import (
+    calculate_color_temperature,
+    calculate_color_temperature_int,
+    calculate_lux,
+    calculate_lux_int,
+)
+
+SAMPLES = 1000
+
+# Made up color_data samples, from dim to bright
+samples = []
+for _ in range(SAMPLES):
+    scale = random.choice((50, 1000, 20000, 65535))
+    samples.append((random.randint(1, scale), random.randint(1, scale), random.randint(1, scale)))
+
+
+def documented_range(r, g, b):
+    """Whether the float version's intermediate n value is in the range the integer version's
+    error is documented for"""
+    x = (-0.14282 * r) + (1.54924 * g) + (-0.95641 * b)
+    y = (-0.32466 * r) + (1.57837 * g) + (-0.73191 * b)
+    z = (-0.68202 * r) + (0.77073 * g) + (0.56332 * b)
+    n = (x / (x + y + z) - 0.3320) / (0.1858 - y / (x + y + z))
+    return -4 <= n <= 4
+
+
+def run(color_temperature, lux):
+    results = []
+    start = time.monotonic()
+    for r, g, b in samples:
+        try:
+            cct = color_temperature(r, g, b)
+        except ZeroDivisionError:
+            cct = None
+        results.append((cct, lux(r, g, b)))
+    return time.monotonic() - start, results
+
+
+float_time, float_results = run(calculate_color_temperature, calculate_lux)
+int_time, int_results = run(calculate_color_temperature_int, calculate_lux_int)
+
+cct_error = 0
+lux_error = 0
+for i, (r, g, b) in enumerate(samples):
+    float_cct, float_lux = float_results[i]
+    int_cct, int_lux = int_results[i]
+    if float_cct is not None and documented_range(r, g, b):
+        cct_error = max(cct_error, abs(int_cct - float_cct) / max(3, float_cct * 0.001))
+    lux_error = max(lux_error, abs(int_lux - float_lux))
+
+print(f"float:   {float_time * 1000:.1f} ms for {SAMPLES} samples")
+print(f"integer: {int_time * 1000:.1f} ms for {SAMPLES} samples")
+print(f"largest color temperature difference: {cct_error:.2f} times 3 K or 0.1%")
+print(f"largest lux difference: {lux_error:.2f}")
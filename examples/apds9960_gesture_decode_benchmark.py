@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compares the per-gesture decode cost of the driver's table-driven classifier with the
+# if/elif chain and per-gesture rotation lookup it replaced.
+
+import time
+
+import board
+
+from adafruit_apds9960 import gesture
+from adafruit_apds9960.apds9960 import APDS9960
+
+ITERATIONS = 2000
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+apds = APDS9960(i2c)
+apds.rotation = 270  # rotation makes the old code do the most work
+
+# "first" and "last" datasets (U, D, L, R) covering every combination of movement
+FRAMES = []
+for first_ud, last_ud in ((200, 60), (120, 120), (60, 200)):
+    for first_lr, last_lr in ((200, 60), (120, 120), (60, 200)):
+        FRAMES.append(
+            bytearray(
+                (2, first_ud, last_ud, first_lr, last_lr, last_ud, first_ud, last_lr, first_lr)
+            )
+        )
+
+
+def legacy_decode(frame):
+    """Gesture classification as done before the lookup table was introduced"""
+    f_r_ud = ((frame[1] - frame[2]) * 100) // (frame[1] + frame[2])
+    f_r_lr = ((frame[3] - frame[4]) * 100) // (frame[3] + frame[4])
+    l_r_ud = ((frame[5] - frame[6]) * 100) // (frame[5] + frame[6])
+    l_r_lr = ((frame[7] - frame[8]) * 100) // (frame[7] + frame[8])
+    delta_ud = l_r_ud - f_r_ud
+    delta_lr = l_r_lr - f_r_lr
+
+    state_ud = 0
+    state_lr = 0
+    if delta_ud >= 30:
+        state_ud = 1
+    elif delta_ud <= -30:
+        state_ud = -1
+    if delta_lr >= 30:
+        state_lr = 1
+    elif delta_lr <= -30:
+        state_lr = -1
+
+    gesture_found = 0
+    if state_ud == -1 and state_lr == 0:
+        gesture_found = 1
+    elif state_ud == 1 and state_lr == 0:
+        gesture_found = 2
+    elif state_ud == 0 and state_lr == -1:
+        gesture_found = 3
+    elif state_ud == 0 and state_lr == 1:
+        gesture_found = 4
+
+    if gesture_found == 0:
+        if state_ud == -1 and state_lr == 1:
+            gesture_found = 1 if abs(delta_ud) > abs(delta_lr) else 4
+        elif state_ud == 1 and state_lr == -1:
+            gesture_found = 2 if abs(delta_ud) > abs(delta_lr) else 3
+        elif state_ud == -1 and state_lr == -1:
+            gesture_found = 1 if abs(delta_ud) > abs(delta_lr) else 3
+        elif state_ud == 1 and state_lr == 1:
+            gesture_found = 2 if abs(delta_ud) > abs(delta_lr) else 3
+
+    if gesture_found != 0 and apds.rotation != 0:
+        dir_lookup = [1, 4, 2, 3]
+        return dir_lookup[(dir_lookup.index(gesture_found) + apds.rotation // 90) % 4]
+    return gesture_found
+
+
+def table_decode(frame):
+    """Gesture classification as done by the driver now"""
+    return gesture._decode(apds, frame)
+
+
+def bench(decode):
+    start = time.monotonic()
+    for _ in range(ITERATIONS):
+        for frame in FRAMES:
+            decode(frame)
+    return (time.monotonic() - start) * 1_000_000 / (ITERATIONS * len(FRAMES))
+
+
+for frame in FRAMES:
+    assert table_decode(frame) == legacy_decode(frame)
+
+before = bench(legacy_decode)
+after = bench(table_decode)
+print(f"if/elif chain:  {before:.2f} us per gesture")
+print(f"lookup table:   {after:.2f} us per gesture")
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Profiles which registers the driver uses the I2C bus for while detecting gestures and reading
+# colors, and how long those transactions take.
+
+import time
+
+import board
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.instrumentation import Instrumentation
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+apds = APDS9960(i2c)
+apds.enable_proximity = True
+apds.enable_gesture = True
+apds.enable_color = True
+
+instrumentation = Instrumentation(trace_size=8)
+instrumentation.attach(apds)
+
+print("Profiling for 10 seconds, swipe over the sensor")
+end = time.monotonic() + 10
+while time.monotonic() < end:
+    gesture = apds.gesture_poll()
+    if gesture:
+        print("gesture", gesture)
+    apds.color_data
+
+instrumentation.detach()
+
+for register, count in sorted(instrumentation.reads.items()):
+    print("read", hex(register), count, "times")
+for register, count in sorted(instrumentation.writes.items()):
+    print("write", hex(register), count, "times")
+print("bytes", instrumentation.bytes)
+for bucket, count in enumerate(instrumentation.histogram):
+    if count:
+        print("under", 2**bucket, "us:", count)
+print("last transactions", instrumentation.trace)
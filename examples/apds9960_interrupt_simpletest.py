@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import board
+import digitalio
+
+from adafruit_apds9960.apds9960 import APDS9960
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+int_pin = digitalio.DigitalInOut(board.D5)
+# int_pin = digitalio.DigitalInOut(board.PROXIMITY_LIGHT_INTERRUPT)  # For CLUE/Feather Sense
+int_pin.switch_to_input(pull=digitalio.Pull.UP)
+
+# the driver only reads the sensor's status while the interrupt pin is asserted
+apds = APDS9960(i2c, interrupt_pin=int_pin)
+
+# fire the proximity interrupt when the proximity reading goes above 175
+apds.proximity_interrupt_threshold = (0, 175)
+apds.enable_proximity_interrupt = True
+apds.enable_proximity = True
+
+# fire the color interrupt every time new color data is ready
+apds.color_integration_time = 72
+apds.enable_color_interrupt = True
+apds.enable_color = True
+
+while True:
+    proximity_int, color_int, _ = apds.interrupt_status
+
+    if proximity_int:
+        print("proximity", apds.proximity)
+    if color_int:
+        print("color", apds.color_data)
+    if proximity_int or color_int:
+        apds.clear_interrupt()
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Measures the import time and heap used by the driver when only color and proximity are used,
+# and how much more loading the gesture engine on the first gesture call adds.
+
+import gc
+import sys
+import time
+
+import board
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+
+def measure(name, function):
+    gc.collect()
+    free = gc.mem_free()
+    start = time.monotonic()
+    result = function()
+    elapsed = time.monotonic() - start
+    gc.collect()
+    print(f"{name:<30}{(free - gc.mem_free()):>8} bytes{elapsed * 1000:>10.1f} ms")
+    return result
+
+
+def import_driver():
+    from adafruit_apds9960.apds9960 import APDS9960  # noqa: PLC0415, measuring the import
+
+    return APDS9960
+
+
+APDS9960 = measure("import apds9960", import_driver)
+apds = measure("APDS9960()", lambda: APDS9960(i2c))
+apds.enable_proximity = True
+apds.enable_color = True
+measure("color_data and proximity", lambda: (apds.color_data, apds.proximity))
+print("gesture engine loaded:", "adafruit_apds9960.gesture" in sys.modules)
+
+apds.enable_gesture = True
+measure("first gesture_poll()", apds.gesture_poll)
+print("gesture engine loaded:", "adafruit_apds9960.gesture" in sys.modules)
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Records gestures, colors and proximity to capture.bin for replaying later with
+# apds9960_replay_benchmark.py. On a microcontroller the filesystem has to be made writable
+# from boot.py first.
+
+import time
+
+import board
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.replay import RecordingI2C
+
+DURATION = 30  # seconds
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+with open("capture.bin", "wb") as capture:
+    apds = APDS9960(RecordingI2C(i2c, capture))
+    apds.enable_proximity = True
+    apds.enable_gesture = True
+    apds.enable_color = True
+
+    print("Recording for", DURATION, "seconds, swipe over the sensor")
+    end = time.monotonic() + DURATION
+    last_color = 0
+    while time.monotonic() < end:
+        gesture = apds.gesture_poll()
+        if gesture:
+            print("gesture", gesture)
+        if time.monotonic() - last_color >= 0.1:
+            last_color = time.monotonic()
+            print("color", apds.color_data, "proximity", apds.proximity)
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Replays a recording made with apds9960_record_simpletest.py, without the sensor attached,
+# and times how long the driver takes to decode it. Meant to be run on a computer, for example:
+#   python apds9960_replay_benchmark.py capture.bin
+
+import sys
+import time
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.colorutility import calculate_color_temperature, calculate_lux
+from adafruit_apds9960.replay import ReplayI2C
+
+with open(sys.argv[1] if len(sys.argv) > 1 else "capture.bin", "rb") as capture:
+    replay = ReplayI2C(capture)
+
+# The recording already holds the sensor's ID and settings, so skip resetting it. The replay's
+# virtual clock lets the driver skip through the recorded delays.
+apds = APDS9960(replay, reset=False, set_defaults=False, clock=replay)
+
+gestures = []
+colors = 0
+# Read the colors on the same schedule as apds9960_record_simpletest.py. Each register's reads
+# are replayed in order, so reading them at other times would move the virtual clock to when
+# they were recorded, ahead of the gesture data.
+last_color = None
+start = time.monotonic()
+while not replay.finished:
+    gesture = apds.gesture_poll()
+    if gesture:
+        gestures.append(gesture)
+    if last_color is None or replay.monotonic() - last_color >= 0.1:
+        last_color = replay.monotonic()
+        colors += 1
+        r, g, b, c = apds.color_data
+        if c:  # The conversions can't handle complete darkness
+            calculate_color_temperature(r, g, b)
+            calculate_lux(r, g, b)
+elapsed = time.monotonic() - start
+
+print("Gestures:", gestures)
+print("Color samples:", colors)
+print(f"Replayed {replay.monotonic():.2f} s of recording in {elapsed:.2f} s")
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Runs the driver against the simulated sensor, so it can be tried out or tested on a computer
+# without an APDS9960 attached.
+
+import time
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.simulator import APDS9960Simulator
+
+sensor = APDS9960Simulator()
+apds = APDS9960(sensor)
+apds.enable_proximity = True
+apds.enable_gesture = True
+apds.enable_color = True
+
+# Light reaching the sensor, as red, green, blue and clear counts per ATIME step at 1x gain
+sensor.light = (0.5, 0.7, 0.4, 1.6)
+sensor.proximity = 20
+
+while not apds.color_data_ready:
+    time.sleep(0.005)
+print("color", apds.color_data, "proximity", apds.proximity)
+
+for direction in (1, 2, 3, 4):
+    sensor.swipe(direction)
+    print("gesture", apds.gesture())
@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Counts the I2C transactions and bytes each part of the driver's API uses, and how long each
+# takes, by running it against the simulated sensor. Meant to be run on a computer:
+#   python apds9960_transaction_benchmark.py
+# Exits with an error if anything uses more transactions or bytes than in BASELINE. After an
+# intentional change, print a new baseline to paste in below with:
+#   python apds9960_transaction_benchmark.py --update
+
+import sys
+import time
+
+from adafruit_apds9960.apds9960 import APDS9960
+from adafruit_apds9960.simulator import APDS9960Simulator
+
+# Call: (transactions, bytes)
+BASELINE = {
+    "APDS9960()": (38, 73),
+    "APDS9960(fast_init=True)": (14, 29),
+    "APDS9960(cache=True)": (33, 88),
+    "batch() profile switch": (4, 8),
+    "cached batch() profile switch": (2, 4),
+    "color_data": (1, 9),
+    "color_data_ready": (1, 2),
+    "color_gain": (1, 2),
+    "color_gain =": (2, 4),
+    "color_integration_time": (1, 2),
+    "color_integration_time =": (1, 2),
+    "enable": (1, 2),
+    "enable =": (2, 4),
+    "enable_color": (1, 2),
+    "enable_color =": (2, 4),
+    "enable_color_interrupt": (1, 2),
+    "enable_color_interrupt =": (2, 4),
+    "enable_gesture": (1, 2),
+    "enable_gesture =": (2, 4),
+    "enable_gesture_interrupt": (1, 2),
+    "enable_gesture_interrupt =": (2, 4),
+    "enable_proximity": (1, 2),
+    "enable_proximity =": (2, 4),
+    "enable_proximity_interrupt": (1, 2),
+    "enable_proximity_interrupt =": (2, 4),
+    "gesture_dimensions": (1, 2),
+    "gesture_dimensions =": (2, 4),
+    "gesture_fifo_threshold": (1, 2),
+    "gesture_fifo_threshold =": (2, 4),
+    "gesture_gain": (1, 2),
+    "gesture_gain =": (2, 4),
+    "gesture_led_drive": (1, 2),
+    "gesture_led_drive =": (2, 4),
+    "gesture_offsets": (4, 8),
+    "gesture_offsets =": (3, 7),
+    "gesture_pulse_count": (1, 2),
+    "gesture_pulse_count =": (2, 4),
+    "gesture_pulse_length": (1, 2),
+    "gesture_pulse_length =": (2, 4),
+    "gesture_stats": (0, 0),
+    "gesture_thresholds": (2, 4),
+    "gesture_thresholds =": (1, 3),
+    "gesture_wait_time": (1, 2),
+    "gesture_wait_time =": (2, 4),
+    "interrupt_status": (1, 2),
+    "proximity": (1, 2),
+    "proximity_gain": (1, 2),
+    "proximity_gain =": (2, 4),
+    "proximity_interrupt_threshold": (3, 6),
+    "proximity_interrupt_threshold =": (4, 8),
+    "rotation": (0, 0),
+    "rotation =": (0, 0),
+    "cached color_data": (1, 9),
+    "cached color_data_ready": (1, 2),
+    "cached color_gain": (0, 0),
+    "cached color_gain =": (1, 2),
+    "cached color_integration_time": (0, 0),
+    "cached color_integration_time =": (1, 2),
+    "cached enable": (0, 0),
+    "cached enable =": (1, 2),
+    "cached enable_color": (0, 0),
+    "cached enable_color =": (1, 2),
+    "cached enable_color_interrupt": (0, 0),
+    "cached enable_color_interrupt =": (1, 2),
+    "cached enable_gesture": (0, 0),
+    "cached enable_gesture =": (1, 2),
+    "cached enable_gesture_interrupt": (1, 2),
+    "cached enable_gesture_interrupt =": (2, 4),
+    "cached enable_proximity": (0, 0),
+    "cached enable_proximity =": (1, 2),
+    "cached enable_proximity_interrupt": (0, 0),
+    "cached enable_proximity_interrupt =": (1, 2),
+    "cached gesture_dimensions": (0, 0),
+    "cached gesture_dimensions =": (1, 2),
+    "cached gesture_fifo_threshold": (0, 0),
+    "cached gesture_fifo_threshold =": (1, 2),
+    "cached gesture_gain": (0, 0),
+    "cached gesture_gain =": (1, 2),
+    "cached gesture_led_drive": (0, 0),
+    "cached gesture_led_drive =": (1, 2),
+    "cached gesture_offsets": (0, 0),
+    "cached gesture_offsets =": (3, 7),
+    "cached gesture_pulse_count": (0, 0),
+    "cached gesture_pulse_count =": (1, 2),
+    "cached gesture_pulse_length": (0, 0),
+    "cached gesture_pulse_length =": (1, 2),
+    "cached gesture_stats": (0, 0),
+    "cached gesture_thresholds": (0, 0),
+    "cached gesture_thresholds =": (1, 3),
+    "cached gesture_wait_time": (0, 0),
+    "cached gesture_wait_time =": (1, 2),
+    "cached interrupt_status": (1, 2),
+    "cached proximity": (1, 2),
+    "cached proximity_gain": (0, 0),
+    "cached proximity_gain =": (1, 2),
+    "cached proximity_interrupt_threshold": (0, 0),
+    "cached proximity_interrupt_threshold =": (3, 6),
+    "cached rotation": (0, 0),
+    "cached rotation =": (0, 0),
+    "clear_interrupt()": (1, 1),
+    "clear_color_interrupt()": (1, 1),
+    "read_snapshot()": (1, 11),
+    "gesture() idle": (1, 3),
+    "gesture() swipe": (4, 56),
+}
+
+
+class CountingI2C:
+    """Passes everything through to a bus, counting the transactions and bytes"""
+
+    def __init__(self, i2c):
+        self.i2c = i2c
+        self.transactions = 0
+        self.bytes = 0
+
+    def try_lock(self):
+        return self.i2c.try_lock()
+
+    def unlock(self):
+        self.i2c.unlock()
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        end = len(buffer) if end is None else end
+        self.transactions += 1
+        self.bytes += end - start
+        self.i2c.writeto(address, buffer, start=start, end=end)
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        end = len(buffer) if end is None else end
+        self.transactions += 1
+        self.bytes += end - start
+        self.i2c.readfrom_into(address, buffer, start=start, end=end)
+
+    def writeto_then_readfrom(
+        self, address, buffer_out, buffer_in, *, out_start=0, out_end=None, in_start=0, in_end=None
+    ):
+        out_end = len(buffer_out) if out_end is None else out_end
+        in_end = len(buffer_in) if in_end is None else in_end
+        self.transactions += 1
+        self.bytes += out_end - out_start + in_end - in_start
+        self.i2c.writeto_then_readfrom(
+            address,
+            buffer_out,
+            buffer_in,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+
+
+sensor = APDS9960Simulator()
+i2c = CountingI2C(sensor)
+results = {}
+
+
+def measure(name, function):
+    i2c.transactions = 0
+    i2c.bytes = 0
+    start = time.monotonic()
+    result = function()
+    elapsed = time.monotonic() - start
+    results[name] = (i2c.transactions, i2c.bytes, elapsed)
+    return result
+
+
+def measure_properties(device, prefix):
+    for name in sorted(dir(APDS9960)):
+        attribute = getattr(APDS9960, name)
+        if not isinstance(attribute, property):
+            continue
+        value = measure(prefix + name, lambda: getattr(device, name))
+        if attribute.fset is not None:
+            measure(prefix + name + " =", lambda: setattr(device, name, value))
+
+
+def switch_profile(device):
+    # From color only to proximity and gestures, as in the APDS9960.batch() docs
+    with device.batch():
+        device.enable_color = False
+        device.enable_proximity = True
+        device.enable_gesture = True
+        device.gesture_gain = 3
+
+
+apds = measure("APDS9960()", lambda: APDS9960(i2c))
+measure("APDS9960(fast_init=True)", lambda: APDS9960(i2c, fast_init=True))
+cached = measure("APDS9960(cache=True)", lambda: APDS9960(i2c, cache=True))
+
+for device in (apds, cached):
+    device.enable_color = True
+    device.enable_proximity = False
+    device.enable_gesture = False
+measure("batch() profile switch", lambda: switch_profile(apds))
+measure("cached batch() profile switch", lambda: switch_profile(cached))
+
+apds.enable_color = True
+measure_properties(apds, "")
+measure_properties(cached, "cached ")
+
+measure("clear_interrupt()", apds.clear_interrupt)
+measure("clear_color_interrupt()", apds.clear_color_interrupt)
+measure("read_snapshot()", apds.read_snapshot)
+measure("gesture() idle", apds.gesture)
+sensor.swipe(1)
+measure("gesture() swipe", apds.gesture)
+
+if "--update" in sys.argv:
+    print("BASELINE = {")
+    for name, (transactions, count, _) in results.items():
+        print(f'    "{name}": ({transactions}, {count}),')
+    print("}")
+    sys.exit()
+
+print(f"{'Call':<35}{'Transactions':>14}{'Bytes':>8}{'Time (ms)':>12}")
+failed = False
+for name, (transactions, count, elapsed) in results.items():
+    note = ""
+    baseline = BASELINE.get(name)
+    if baseline is None:
+        note = "  no baseline"
+    elif transactions > baseline[0] or count > baseline[1]:
+        note = f"  REGRESSION, was {baseline[0]} transactions and {baseline[1]} bytes"
+        failed = True
+    print(f"{name:<35}{transactions:>14}{count:>8}{elapsed * 1000:>12.2f}{note}")
+
+if failed:
+    sys.exit(1)